@@ -20,13 +20,15 @@ TODO: Implement actual API calls in ValidatorBurnDataSource methods:
 """
 from abc import ABC, abstractmethod
 from datetime import timedelta
-from typing import Callable, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import requests
 from bittensor.utils.btlogging import logging
 import bittensor as bt
 import os
 
+from bitads_v3_core.domain.models import MinerWindowStats
+
 
 from core.constants import MINER_EMISSION_PERCENT, NETWORK_BASE_URLS
 
@@ -92,6 +94,34 @@ class ValidatorBurnDataSource(IBurnDataSource):
         self.window_days_getter = window_days_getter
         self.sales_emission_ratio_getter = sales_emission_ratio_getter
         self.miner_stats_source = miner_stats_source
+        # Per-iteration miner stats keyed by campaign scope, set by the validator
+        # so total sales are derived without refetching the same window.
+        self._miner_stats_cache: Dict[str, List[Tuple[str, MinerWindowStats]]] = {}
+        # Subnet-wide inputs shared by every scope, memoized for one iteration so
+        # campaigns resolved in the same cycle do not repeat the subtensor query
+        # and the price request.
+        self._subnet_tao_in_emission: Optional[int] = None
+        self._tao_price_usd: Optional[float] = None
+
+    def set_miner_stats_cache(self, campaign_scope: str, miner_stats: List[Tuple[str, MinerWindowStats]]) -> None:
+        """
+        Set miner stats for a campaign scope to avoid a duplicate fetch.
+        
+        Args:
+            campaign_scope: Campaign scope identifier (campaign_id)
+            miner_stats: List of (miner_id, MinerWindowStats) tuples
+        """
+        self._miner_stats_cache[campaign_scope] = miner_stats
+
+    def clear_miner_stats_cache(self) -> None:
+        """Clear all cached miner stats."""
+        self._miner_stats_cache.clear()
+
+    def clear_cycle_cache(self) -> None:
+        """Clear cached miner stats and the memoized subnet emission and TAO price."""
+        self._miner_stats_cache.clear()
+        self._subnet_tao_in_emission = None
+        self._tao_price_usd = None
         
     def get_burn_data(self, scope: str, miner_stats_scope: str = None) -> Optional[BurnCalculationData]:
         """
@@ -149,17 +179,21 @@ class ValidatorBurnDataSource(IBurnDataSource):
             Emission amount in TAO per block, or None if unavailable
         """
         try:
-            subnet_tao_in_emission = self.subtensor.query_subtensor("SubnetTaoInEmission", params=[self.netuid])
+            subnet_tao_in_emission_value = self._subnet_tao_in_emission
+            if subnet_tao_in_emission_value is None:
+                subnet_tao_in_emission = self.subtensor.query_subtensor("SubnetTaoInEmission", params=[self.netuid])
 
-            if subnet_tao_in_emission is None:
-                logging.warning("Failed to fetch SubnetTaoInEmission from subtensor")
-                return None
+                if subnet_tao_in_emission is None:
+                    logging.warning("Failed to fetch SubnetTaoInEmission from subtensor")
+                    return None
 
-            subnet_tao_in_emission_value = subnet_tao_in_emission.value if hasattr(subnet_tao_in_emission, 'value') else subnet_tao_in_emission
+                subnet_tao_in_emission_value = subnet_tao_in_emission.value if hasattr(subnet_tao_in_emission, 'value') else subnet_tao_in_emission
 
-            if not isinstance(subnet_tao_in_emission_value, (int, float)) or subnet_tao_in_emission_value < 0:
-                logging.warning(f"Invalid SubnetTaoInEmission value: {subnet_tao_in_emission_value}")
-                return None
+                if not isinstance(subnet_tao_in_emission_value, (int, float)) or subnet_tao_in_emission_value < 0:
+                    logging.warning(f"Invalid SubnetTaoInEmission value: {subnet_tao_in_emission_value}")
+                    return None
+
+                self._subnet_tao_in_emission = subnet_tao_in_emission_value
 
             # Window days should be fetched for mech_scope (scope) because config is stored per mechanism
             window_days_scope_to_use = window_days_scope if window_days_scope is not None else scope
@@ -188,6 +222,9 @@ class ValidatorBurnDataSource(IBurnDataSource):
         Returns:
             TAO price in USD, or None if unavailable
         """
+        if self._tao_price_usd is not None:
+            return self._tao_price_usd
+
         try:
             url = "https://mainnet.scantensor.opentensor.ai/price"
             response = requests.get(url, timeout=10)
@@ -205,7 +242,8 @@ class ValidatorBurnDataSource(IBurnDataSource):
                 return None
             
             logging.info(f"Fetched TAO price: ${price:.2f} USD")
-            return float(price)
+            self._tao_price_usd = float(price)
+            return self._tao_price_usd
             
         except requests.exceptions.RequestException as e:
             logging.warning(f"Failed to fetch TAO price from API: {e}")
@@ -237,8 +275,11 @@ class ValidatorBurnDataSource(IBurnDataSource):
             window_days = self.window_days_getter(config_scope)
             logging.info(f"BurnDataSource._fetch_total_sales_usd: campaign_scope={scope}, config_scope={config_scope}, window_days={window_days}")
             
-            # Fetch miner stats using the injected provider with campaign scope
-            miner_stats_list = self.miner_stats_source.fetch_window(scope, window_days)
+            # Reuse stats already fetched this iteration, otherwise fetch them using
+            # the injected provider with campaign scope
+            miner_stats_list = self._miner_stats_cache.get(scope)
+            if miner_stats_list is None:
+                miner_stats_list = self.miner_stats_source.fetch_window(scope, window_days)
             if not miner_stats_list:
                 logging.warning(f"No miner stats available to compute total_sales_usd for scope {scope}")
                 return None
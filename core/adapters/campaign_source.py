@@ -2,8 +2,9 @@
 Interface for fetching campaigns from external sources.
 """
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Callable, List, Optional
 import os
+import time
 import requests
 from bittensor.utils.btlogging import logging
 
@@ -70,23 +71,22 @@ class ValidatorCampaignSource(ICampaignSource):
                 
                 # Only include campaigns with status = 1 (active)
                 if campaign_id is not None and mech_id is not None and status == 1:
-                    campaigns.append(
-                        Campaign(
-                            scope=campaign_id,
-                            mech_id=mech_id,
-                            emission_split=emission_split,
-                        )
+                    campaign = Campaign(
+                        scope=campaign_id,
+                        mech_id=mech_id,
+                        emission_split=emission_split,
                     )
+                    campaigns.append(campaign)
                     logging.info(
                         f"✓ Added active campaign: campaign_id={campaign_id}, mech_id={mech_id}, "
-                        f"emission_split={emission_split}, mech_scope=mech{mech_id}"
+                        f"emission_split={emission_split}, mech_scope={campaign.mech_scope}"
                     )
                 elif campaign_id is not None:
                     logging.info(f"✗ Skipped inactive campaign: campaign_id={campaign_id}, mech_id={mech_id}, status={status}")
             
             logging.info(f"Fetched {len(campaigns)} active campaigns from API (status=1)")
             if campaigns:
-                logging.info(f"Active campaigns mapping: {[(c.scope, c.mech_id, f'mech{c.mech_id}') for c in campaigns]}")
+                logging.info(f"Active campaigns mapping: {[(c.scope, c.mech_id, c.mech_scope) for c in campaigns]}")
             return campaigns
             
         except requests.exceptions.RequestException as e:
@@ -152,23 +152,22 @@ class StorageCampaignSource(ICampaignSource):
                 
                 # Only include campaigns with status = 1 (active)
                 if campaign_id is not None and status == 1:
-                    campaigns.append(
-                        Campaign(
-                            scope=campaign_id,
-                            mech_id=mech_id,
-                            emission_split=emission_split,
-                        )
+                    campaign = Campaign(
+                        scope=campaign_id,
+                        mech_id=mech_id,
+                        emission_split=emission_split,
                     )
+                    campaigns.append(campaign)
                     logging.info(
                         f"✓ Added active campaign: campaign_id={campaign_id}, mech_id={mech_id}, "
-                        f"emission_split={emission_split}, mech_scope=mech{mech_id}"
+                        f"emission_split={emission_split}, mech_scope={campaign.mech_scope}"
                     )
                 elif campaign_id is not None:
                     logging.info(f"✗ Skipped inactive campaign: campaign_id={campaign_id}, mech_id={mech_id}, status={status}")
             
             logging.info(f"Fetched {len(campaigns)} active campaigns from storage (status=1)")
             if campaigns:
-                logging.info(f"Active campaigns mapping: {[(c.scope, c.mech_id, f'mech{c.mech_id}') for c in campaigns]}")
+                logging.info(f"Active campaigns mapping: {[(c.scope, c.mech_id, c.mech_scope) for c in campaigns]}")
             return campaigns
             
         except requests.exceptions.RequestException as e:
@@ -177,3 +176,63 @@ class StorageCampaignSource(ICampaignSource):
         except (ValueError, KeyError, TypeError) as e:
             logging.warning(f"Failed to parse campaigns storage response: {e}")
             return []
+
+
+class CachedCampaignSource(ICampaignSource):
+    """
+    Campaign source decorator that caches campaigns for a fixed TTL.
+    
+    Campaigns rarely change within a tempo, so the wrapped source is only
+    queried again once the cached list expires or is explicitly invalidated.
+    """
+    
+    def __init__(
+        self,
+        source: ICampaignSource,
+        ttl: float,
+        on_refresh: Optional[Callable[[List[Campaign]], None]] = None,
+    ):
+        """
+        Initialize cached campaign source.
+        
+        Args:
+            source: Campaign source to fetch from on cache miss
+            ttl: Cache time-to-live in seconds
+            on_refresh: Optional callback invoked with the campaigns after each refetch
+                        that returned campaigns, used to keep campaign-derived mappings in sync
+        """
+        self.source = source
+        self.on_refresh = on_refresh
+        self._ttl = ttl
+        self._campaigns: Optional[List[Campaign]] = None
+        self._expires_at = 0.0
+    
+    def get_campaigns(self) -> List[Campaign]:
+        """
+        Get list of active campaigns, served from cache while it is valid.
+        
+        Empty results are not cached so a failed fetch is retried on the next call.
+        
+        Returns:
+            List of Campaign objects
+        """
+        current_time = time.time()
+        if self._campaigns is not None and current_time < self._expires_at:
+            logging.debug(f"Using {len(self._campaigns)} cached campaigns")
+            return list(self._campaigns)
+        
+        campaigns = self.source.get_campaigns()
+        if campaigns:
+            self._campaigns = campaigns
+            self._expires_at = current_time + self._ttl
+            if self.on_refresh is not None:
+                self.on_refresh(campaigns)
+        else:
+            # A failed or empty fetch keeps campaign-derived mappings as they were
+            self.invalidate()
+        return list(campaigns)
+    
+    def invalidate(self) -> None:
+        """Drop cached campaigns so the next get_campaigns() call refetches."""
+        self._campaigns = None
+        self._expires_at = 0.0
@@ -6,7 +6,7 @@ at runtime, such as window_days, sales_emission_ratio, and P95 config.
 """
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional, Dict, Tuple
+from typing import Optional, Dict, Iterable, Tuple
 import os
 import time
 import requests
@@ -84,6 +84,28 @@ class IDynamicConfigSource(ABC):
             DynamicConfig with all configuration values, or None if unavailable
         """
         pass
+    
+    def get_configs(self, scopes: Iterable[str]) -> Dict[str, Optional[DynamicConfig]]:
+        """
+        Get dynamic configuration for several scopes at once.
+        
+        The default implementation calls get_config() per scope; sources that can
+        serve every scope from a single fetch should override it.
+        
+        Args:
+            scopes: Scope identifiers (e.g., "mech0", "mech1")
+        
+        Returns:
+            Dictionary mapping each scope to its DynamicConfig (None if unavailable)
+        """
+        return {scope: self.get_config(scope) for scope in scopes}
+    
+    def invalidate(self) -> None:
+        """
+        Drop any cached configuration so the next lookup fetches fresh data.
+        
+        The default implementation does nothing; caching sources override it.
+        """
 
 
 class ValidatorDynamicConfigSource(IDynamicConfigSource):
@@ -107,6 +129,10 @@ class ValidatorDynamicConfigSource(IDynamicConfigSource):
         # Cache structure: {scope: (config_data, timestamp)}
         self._cache: Dict[str, Tuple[dict, float]] = {}
     
+    def invalidate(self) -> None:
+        """Drop all cached per-scope configs."""
+        self._cache.clear()
+    
     def _fetch_config_raw(self, scope: str) -> Optional[dict]:
         """
         Fetch config from API for a given scope.
@@ -241,8 +267,12 @@ class StorageDynamicConfigSource(IDynamicConfigSource):
         self.network = network or os.getenv("SUBTENSOR_NETWORK", "finney").lower()
         self.base_url = NETWORK_BASE_URLS.get(self.network)
         self.cache_ttl = cache_ttl
-        # Cache structure: (config_data, timestamp)
-        self._cache: Optional[Tuple[dict, float]] = None
+        # Cache structure: (config_data, timestamp, parsed DynamicConfig per scope)
+        self._cache: Optional[Tuple[dict, float, Dict[str, Optional[DynamicConfig]]]] = None
+    
+    def invalidate(self) -> None:
+        """Drop the cached subnet_config.json and its parsed scope configs."""
+        self._cache = None
     
     def _fetch_config_raw(self) -> Optional[dict]:
         """
@@ -257,7 +287,7 @@ class StorageDynamicConfigSource(IDynamicConfigSource):
         
         # Check cache first
         if self._cache is not None:
-            cached_data, cache_timestamp = self._cache
+            cached_data, cache_timestamp, _ = self._cache
             if current_time - cache_timestamp < self.cache_ttl:
                 logging.debug("Using cached config from storage")
                 return cached_data
@@ -280,8 +310,8 @@ class StorageDynamicConfigSource(IDynamicConfigSource):
             response.raise_for_status()
             config_data = response.json()
             
-            # Store in cache
-            self._cache = (config_data, current_time)
+            # Store in cache; scope configs are parsed lazily into the empty dict
+            self._cache = (config_data, current_time, {})
             logging.debug("Fetched and cached config from storage")
             return config_data
             
@@ -308,7 +338,60 @@ class StorageDynamicConfigSource(IDynamicConfigSource):
         config_data = self._fetch_config_raw()
         if config_data is None:
             return None
+        return self._get_parsed_scope_config(config_data, scope)
+    
+    def get_configs(self, scopes: Iterable[str]) -> Dict[str, Optional[DynamicConfig]]:
+        """
+        Get dynamic configuration for several mechanism scopes from one fetch.
+        
+        subnet_config.json holds every scope, so the file is read (or taken from
+        cache) once and parsed per scope.
         
+        Args:
+            scopes: Mechanism scope identifiers (e.g., "mech0", "mech1")
+        
+        Returns:
+            Dictionary mapping each scope to its DynamicConfig (None if unavailable)
+        """
+        config_data = self._fetch_config_raw()
+        if config_data is None:
+            return {scope: None for scope in scopes}
+        return {scope: self._get_parsed_scope_config(config_data, scope) for scope in scopes}
+    
+    def _get_parsed_scope_config(self, config_data: dict, scope: str) -> Optional[DynamicConfig]:
+        """
+        Parse a scope's configuration once per fetched subnet_config.json.
+        
+        Parsed configs are kept alongside the cached file, so they are dropped
+        together with it when the TTL expires or the cache is invalidated.
+        
+        Args:
+            config_data: subnet_config.json content returned by _fetch_config_raw()
+            scope: Mechanism scope identifier (e.g., "mech0", "mech1")
+        
+        Returns:
+            DynamicConfig for the scope, or None if missing or invalid
+        """
+        cache = self._cache
+        if cache is None or cache[0] is not config_data:
+            # Data was not cached (or was replaced meanwhile); parse without memoizing
+            return self._parse_scope_config(config_data, scope)
+        parsed = cache[2]
+        if scope not in parsed:
+            parsed[scope] = self._parse_scope_config(config_data, scope)
+        return parsed[scope]
+    
+    def _parse_scope_config(self, config_data: dict, scope: str) -> Optional[DynamicConfig]:
+        """
+        Parse the configuration of a single scope out of subnet_config.json data.
+        
+        Args:
+            config_data: Parsed subnet_config.json content
+            scope: Mechanism scope identifier (e.g., "mech0", "mech1")
+        
+        Returns:
+            DynamicConfig for the scope, or None if missing or invalid
+        """
         try:
             # Get scope-specific config from config.config[scope]
             # Structure: { "config": { "mech0": {...}, "mech1": {...} } }
@@ -1,4 +1,5 @@
-from typing import List, Tuple
+from concurrent.futures import Executor
+from typing import Dict, List, Optional, Sequence, Tuple
 import os
 import requests
 from bittensor.utils.btlogging import logging
@@ -93,6 +94,8 @@ class StorageMinerStatsSource(IMinerStatsSource):
         """
         self.network = network or os.getenv("SUBTENSOR_NETWORK", "finney").lower()
         self.base_url = NETWORK_BASE_URLS.get(self.network)
+        # Keep-alive session so repeated fetches reuse the connection to storage.
+        self._session = requests.Session()
     
     def fetch_window(self, scope: str, window_days: int = DEFAULT_WINDOW_DAYS) -> List[Tuple[str, MinerWindowStats]]:
         """
@@ -116,7 +119,7 @@ class StorageMinerStatsSource(IMinerStatsSource):
         try:
             # URL pattern: subnet_miner-stats-{scope}.json
             url = f"{self.base_url}/data/subnet_miner-stats-{scope}.json"
-            response = requests.get(url, timeout=10)
+            response = self._session.get(url, timeout=10)
             response.raise_for_status()
             # Storage returns array directly, not wrapped in "miners"
             miners_data = response.json()
@@ -151,3 +154,27 @@ class StorageMinerStatsSource(IMinerStatsSource):
             logging.warning(f"Failed to parse miner stats storage response for scope {scope}: {e}")
             return []
 
+    def fetch_window_many(
+        self,
+        scope_windows: Sequence[Tuple[str, int]],
+        executor: Optional[Executor] = None,
+    ) -> Dict[Tuple[str, int], List[Tuple[str, MinerWindowStats]]]:
+        """
+        Fetch miner statistics for several scopes at once.
+        
+        Storage keeps one file per scope, so there is no single bulk request; the
+        per-scope GETs share this source's keep-alive session and, when an executor
+        is given, run concurrently on it.
+        
+        Args:
+            scope_windows: (scope, window_days) pairs to fetch
+            executor: Optional executor to run the fetches on concurrently
+        
+        Returns:
+            Dictionary mapping (scope, window_days) -> list of (miner_id, MinerWindowStats)
+        """
+        # Each distinct (scope, window_days) pair is fetched once
+        unique_windows = list(dict.fromkeys(scope_windows))
+        map_fn = executor.map if executor is not None else map
+        results = map_fn(lambda scope_window: self.fetch_window(*scope_window), unique_windows)
+        return dict(zip(unique_windows, results))
@@ -1,3 +1,4 @@
+import threading
 from typing import Dict, Optional, List, Tuple
 
 from bittensor.utils.btlogging import logging
@@ -29,9 +30,17 @@ class ValidatorP95Provider(IP95Provider):
         # Cache for miner stats to avoid duplicate fetches
         # Key: campaign_scope (campaign_id), Value: List[Tuple[str, MinerWindowStats]]
         self._miner_stats_cache: Dict[str, List[Tuple[str, MinerWindowStats]]] = {}
+        # Campaign scores are computed on worker threads; the lock keeps the
+        # caches consistent and ensures each scope's percentiles are computed once.
+        self._lock = threading.Lock()
 
     def get_effective_p95(self, scope: str) -> Percentiles:
         """Get effective P95 percentiles for the given scope."""
+        with self._lock:
+            return self._get_effective_p95_locked(scope)
+
+    def _get_effective_p95_locked(self, scope: str) -> Percentiles:
+        """Compute (or return cached) P95 percentiles; caller must hold ``_lock``."""
         if scope in self.current_percentiles:
             logging.debug(f"P95Provider: using cached percentiles for scope='{scope}'")
             return self.current_percentiles[scope]
@@ -84,6 +93,22 @@ class ValidatorP95Provider(IP95Provider):
         self.current_percentiles[scope] = percentiles
         return percentiles
 
+    def update_mech_scope_mapping(self, mech_scope_to_campaign_scope: Dict[str, str]) -> bool:
+        """
+        Replace the mech_scope -> campaign_scope mapping used for miner stats lookups.
+        
+        Args:
+            mech_scope_to_campaign_scope: New mapping from mech_scope to primary campaign_scope
+        
+        Returns:
+            True if the mapping changed, False if it was already current
+        """
+        with self._lock:
+            if mech_scope_to_campaign_scope == self.mech_scope_to_campaign_scope:
+                return False
+            self.mech_scope_to_campaign_scope = dict(mech_scope_to_campaign_scope)
+        return True
+
     def set_miner_stats_cache(self, campaign_scope: str, miner_stats: List[Tuple[str, MinerWindowStats]]) -> None:
         """
         Set miner stats cache for a campaign scope to avoid duplicate fetches.
@@ -96,7 +121,8 @@ class ValidatorP95Provider(IP95Provider):
             campaign_scope: Campaign scope identifier (campaign_id)
             miner_stats: List of (miner_id, MinerWindowStats) tuples
         """
-        self._miner_stats_cache[campaign_scope] = miner_stats
+        with self._lock:
+            self._miner_stats_cache[campaign_scope] = miner_stats
         logging.info(f"P95Provider: cached {len(miner_stats)} miner stats for campaign_scope='{campaign_scope}' (will be reused for this iteration)")
     
     def clear_miner_stats_cache(self, campaign_scope: str = None) -> None:
@@ -107,19 +133,20 @@ class ValidatorP95Provider(IP95Provider):
             campaign_scope: If provided, clears cache only for this campaign. 
                           If None, clears all cached stats.
         """
-        if campaign_scope is not None:
-            if campaign_scope in self._miner_stats_cache:
-                del self._miner_stats_cache[campaign_scope]
-                logging.debug(f"P95Provider: cleared miner stats cache for campaign_scope='{campaign_scope}'")
-        else:
-            self._miner_stats_cache.clear()
-            logging.debug("P95Provider: cleared all miner stats cache")
+        with self._lock:
+            if campaign_scope is not None:
+                if self._miner_stats_cache.pop(campaign_scope, None) is not None:
+                    logging.debug(f"P95Provider: cleared miner stats cache for campaign_scope='{campaign_scope}'")
+            else:
+                self._miner_stats_cache.clear()
+                logging.debug("P95Provider: cleared all miner stats cache")
     
     def update_percentiles(self):
         """Move current percentiles to prev and clear cache for next iteration."""
-        self.prev_percentiles = self.current_percentiles.copy()
-        self.current_percentiles.clear()
-        # Clear miner stats cache as well
-        self._miner_stats_cache.clear()
+        with self._lock:
+            self.prev_percentiles = self.current_percentiles.copy()
+            self.current_percentiles.clear()
+            # Clear miner stats cache as well
+            self._miner_stats_cache.clear()
 
 
@@ -8,7 +8,8 @@ API: {base_url}/data/subnet_pending_miners-{campaign_id}.json
 Example: https://dev-storage.bitads.ai/data/subnet_pending_miners-0497f5b9-ab35-4848-854b-623be3198fb9.json
 """
 import os
-from typing import List
+from concurrent.futures import Executor
+from typing import Dict, List, Optional, Sequence
 
 import requests
 from bittensor.utils.btlogging import logging
@@ -34,6 +35,27 @@ class IPendingMinersSource:
         """
         raise NotImplementedError
 
+    def get_pending_miners_many(
+        self,
+        campaign_ids: Sequence[str],
+        executor: Optional[Executor] = None,
+    ) -> Dict[str, List[str]]:
+        """
+        Get pending miners for several campaigns at once.
+
+        The default implementation calls get_pending_miners per campaign,
+        concurrently on the executor when one is given.
+
+        Args:
+            campaign_ids: Campaign scope identifiers (UUIDs).
+            executor: Optional executor to run the lookups on concurrently.
+
+        Returns:
+            Dictionary mapping campaign_id -> list of pending miner hotkeys.
+        """
+        map_fn = executor.map if executor is not None else map
+        return dict(zip(campaign_ids, map_fn(self.get_pending_miners, campaign_ids)))
+
 
 class StoragePendingMinersSource(IPendingMinersSource):
     """
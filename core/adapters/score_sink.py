@@ -1,14 +1,16 @@
-from typing import Callable, Dict, List, Optional, Tuple
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
-from bittensor.core.settings import DEFAULT_PERIOD
+import numpy as np
+from bittensor.core.settings import BLOCKTIME, DEFAULT_PERIOD
 from bittensor.core.subtensor import commit_timelocked_weights_extrinsic, set_weights_extrinsic
 from bittensor.core.types import UIDs, Weights
 from bittensor.utils.btlogging import logging
 import bittensor as bt
 from bitads_v3_core.app.ports import IScoreSink
 from bitads_v3_core.domain.models import ScoreResult
-from bitads_v3_core.domain.creator_burn import apply_creator_burn
 from core import version_as_int
+from core.burn_calculator import apply_creator_burn_np
 
 
 class ValidatorScoreSink(IScoreSink):
@@ -34,6 +36,42 @@ class ValidatorScoreSink(IScoreSink):
         # Callable that takes scope and returns burn percentage
         # (None means no burn, 0.0-100.0 for burn percentage)
         self.burn_percentage_resolver = burn_percentage_resolver
+        # Hotkey -> metagraph index, rebuilt when the metagraph's hotkey list changes
+        self._hotkey_index: Dict[str, int] = {}
+        self._hotkey_index_source: Optional[List[str]] = None
+        # Subnet owner hotkey and the monotonic time it was fetched; owner changes
+        # are rare, so it is re-queried at most once per tempo.
+        self._owner_hotkey: Optional[Tuple[str, float]] = None
+        # Read-only owner-only weight vector and the (owner_index, n_uids) it was built for
+        self._owner_only_weights: Optional[np.ndarray] = None
+        self._owner_only_key: Optional[Tuple[int, int]] = None
+
+    def _get_hotkey_index(self) -> Dict[str, int]:
+        """
+        Get the hotkey -> index map for the current metagraph.
+        
+        Returns:
+            Dictionary mapping hotkey to its position in metagraph.hotkeys
+        """
+        hotkeys = self.metagraph.hotkeys
+        if hotkeys is not self._hotkey_index_source or len(hotkeys) != len(self._hotkey_index):
+            self._hotkey_index = {hotkey: index for index, hotkey in enumerate(hotkeys)}
+            self._hotkey_index_source = hotkeys
+        return self._hotkey_index
+
+    def _get_owner_hotkey(self) -> str:
+        """
+        Get the subnet owner's hotkey, cached for one tempo.
+        
+        Returns:
+            Owner hotkey (ss58 address)
+        """
+        now = time.monotonic()
+        if self._owner_hotkey is not None and now - self._owner_hotkey[1] < self.tempo * BLOCKTIME:
+            return self._owner_hotkey[0]
+        owner_hotkey = self.subtensor.get_subnet_owner_hotkey(self.netuid)
+        self._owner_hotkey = (owner_hotkey, now)
+        return owner_hotkey
 
     def _get_owner_uid(self) -> Optional[int]:
         """
@@ -42,13 +80,9 @@ class ValidatorScoreSink(IScoreSink):
         Returns:
             Owner UID if found, None otherwise
         """
-        try:
-            owner_hotkey = self.subtensor.get_subnet_owner_hotkey(self.netuid)
-            index = self.metagraph.hotkeys.index(owner_hotkey)
-            if index < len(self.metagraph.uids):
-                return self.metagraph.uids[index]
-        except (ValueError, AttributeError, IndexError, Exception) as e:
-            logging.warning(f"Failed to get owner UID: {e}")
+        index = self._get_owner_index()
+        if index is not None:
+            return self.metagraph.uids[index]
         return None
 
     def _get_owner_index(self) -> Optional[int]:
@@ -59,11 +93,13 @@ class ValidatorScoreSink(IScoreSink):
             Owner index if found, None otherwise
         """
         try:
-            owner_hotkey = self.subtensor.get_subnet_owner_hotkey(self.netuid)
-            index = self.metagraph.hotkeys.index(owner_hotkey)
-            if index < len(self.metagraph.uids):
+            owner_hotkey = self._get_owner_hotkey()
+            index = self._get_hotkey_index().get(owner_hotkey)
+            if index is None:
+                logging.warning(f"Failed to get owner index: owner hotkey {owner_hotkey} not in metagraph")
+            elif index < len(self.metagraph.uids):
                 return index
-        except (ValueError, AttributeError, IndexError, Exception) as e:
+        except Exception as e:
             logging.warning(f"Failed to get owner index: {e}")
         return None
 
@@ -86,40 +122,97 @@ class ValidatorScoreSink(IScoreSink):
             rounded[idx_max] = round(rounded[idx_max] + diff, self._WEIGHTS_DECIMALS)
         return rounded
 
-    def _set_owner_weight_fallback(self, weights: List[float]) -> None:
+    def _set_owner_weight_fallback(self, weights: np.ndarray) -> None:
         """
         Set the subnet owner's weight to 1.0 as fallback when all scores are zero.
 
         Args:
-            weights: List of weights aligned to metagraph.uids (modified in place)
+            weights: Weights aligned to metagraph.uids (modified in place)
         """
         owner_index = self._get_owner_index()
         if owner_index is not None:
             weights[owner_index] = 1.0
 
-    def set_weights_to_owner_only(self) -> Tuple[bool, str]:
+    def _get_owner_only_weights(self, owner_index: int) -> np.ndarray:
+        """
+        Get the owner-only weight vector (1.0 at the owner, 0.0 elsewhere).
+        
+        The vector is rebuilt only when the owner index or the number of UIDs
+        changes, so repeated fallbacks reuse the same read-only array.
+        
+        Args:
+            owner_index: Owner index in metagraph.uids
+        
+        Returns:
+            Read-only weights aligned to metagraph.uids
+        """
+        key = (owner_index, len(self.metagraph.uids))
+        if self._owner_only_weights is None or self._owner_only_key != key:
+            weights = np.zeros(key[1])
+            weights[owner_index] = 1.0
+            weights.flags.writeable = False
+            self._owner_only_weights = weights
+            self._owner_only_key = key
+        return self._owner_only_weights
+
+    def set_weights_to_owner_only(self, owner_index: Optional[int] = None) -> Tuple[bool, str]:
         """
         Set weights to subnet owner only (burn behaviour). Used when there are no
         campaigns or when normal weight setting fails.
 
+        Args:
+            owner_index: Owner index already resolved by the caller; looked up
+                        when not provided.
+
         Returns:
             (success, message) from the set_weights extrinsic.
         """
-        owner_index = self._get_owner_index()
+        if owner_index is None:
+            owner_index = self._get_owner_index()
         if owner_index is None:
             logging.warning("Cannot set weights to owner: owner UID not found")
             return False, "Owner UID not found"
-        weights = [0.0] * len(self.metagraph.uids)
-        weights[owner_index] = 1.0
-        weights = self._round_weights(weights)
         logging.info("Setting weights to subnet owner only (burn behaviour)")
         return self._set_weights(
             wallet=self.wallet,
             netuid=self.netuid,
             uids=self.metagraph.uids,
-            weights=weights,
+            weights=self._get_owner_only_weights(owner_index),
+            wait_for_inclusion=True,
+        )
+
+    def publish_weights(self, weights: Sequence[float], scope: str) -> Tuple[bool, str]:
+        """
+        Publish final weights that are already aligned to metagraph.uids.
+        
+        Fast path for callers that computed (and burned) the weights themselves:
+        skips the ScoreResult round trip and the burn step of publish(). Weights are
+        only normalized and rounded; an all-zero vector falls back to the owner.
+        
+        Args:
+            weights: Non-negative weights aligned to metagraph.uids
+            scope: Scope identifier used for logging (e.g., "mech0")
+        
+        Returns:
+            (success, message) from the set_weights extrinsic.
+        """
+        weights_arr = np.asarray(weights, dtype=np.float64)
+        total = weights_arr.sum()
+        if total <= 0:
+            logging.info(f"All-zero weights for scope {scope}; using burn (set weights to subnet owner).")
+            return self.set_weights_to_owner_only()
+
+        final_weights = self._round_weights((weights_arr / total).tolist())
+        logging.info(f"[blue]Setting weights for {scope} (pre-burned, no burn applied):[/blue] {final_weights}")
+        success, message = self._set_weights(
+            wallet=self.wallet,
+            netuid=self.netuid,
+            uids=self.metagraph.uids,
+            weights=final_weights,
             wait_for_inclusion=True,
         )
+        logging.info(f"Set weights result for {scope}: success={success}, message={message}")
+        return success, message
 
     def publish(
         self,
@@ -127,6 +220,7 @@ class ValidatorScoreSink(IScoreSink):
         scope: str,
         miner_stats_scope: str = None,
         apply_burn: bool = True,
+        hotkey_to_index: Optional[Dict[str, int]] = None,
     ) -> Tuple[bool, str]:
         """
         Publish score results by setting weights on-chain for the given scope.
@@ -140,6 +234,8 @@ class ValidatorScoreSink(IScoreSink):
             miner_stats_scope: Scope identifier for fetching miner stats (e.g., campaign_id).
                               If not provided, uses scope.
             apply_burn: If False, scores are treated as final weights and no burn is applied.
+            hotkey_to_index: Hotkey -> metagraph index map for the current metagraph,
+                            if the caller already maintains one; built here otherwise.
         
         Returns:
             (success, message) from the set_weights extrinsic.
@@ -151,39 +247,32 @@ class ValidatorScoreSink(IScoreSink):
             logging.info(f"Empty score results for scope {scope}; using burn (set weights to subnet owner).")
             return self.set_weights_to_owner_only()
 
-        # Build UID->score map
-        # miner_id is a hotkey string, need to find corresponding UID
-        scores_by_uid: Dict[int, float] = {}
-        for result in scores:
-            try:
-                # miner_id is a hotkey string, find its UID in metagraph
-                if result.miner_id not in self.metagraph.hotkeys:
-                    logging.warning(f"Hotkey {result.miner_id} not found in metagraph for scope {scope}")
-                    continue
-                
-                hotkey_index = self.metagraph.hotkeys.index(result.miner_id)
-                if hotkey_index < len(self.metagraph.uids):
-                    uid = self.metagraph.uids[hotkey_index]
-                    scores_by_uid[uid] = result.score
-                else:
-                    logging.warning(f"Hotkey index {hotkey_index} out of range for UIDs in scope {scope}")
-            except (ValueError, AttributeError, IndexError) as e:
-                logging.warning(f"Could not map miner_id (hotkey) {result.miner_id} to UID for scope {scope}: {e}")
-
-        # Build initial weights aligned to metagraph.uids
+        # Scatter scores into a vector aligned to metagraph.uids
+        # miner_id is a hotkey string, need to find corresponding index
         # Miners not in scores get 0.0 (no work = no score)
-        uids = list(self.metagraph.uids)
-        miner_scores = [scores_by_uid.get(uid, 0.0) for uid in uids]
+        if hotkey_to_index is None:
+            hotkey_to_index = self._get_hotkey_index()
+        n_uids = len(self.metagraph.uids)
+        miner_scores = np.zeros(n_uids)
+        for result in scores:
+            hotkey_index = hotkey_to_index.get(result.miner_id)
+            if hotkey_index is None:
+                logging.warning(f"Hotkey {result.miner_id} not found in metagraph for scope {scope}")
+                continue
+            if hotkey_index < n_uids:
+                miner_scores[hotkey_index] = result.score
+            else:
+                logging.warning(f"Hotkey index {hotkey_index} out of range for UIDs in scope {scope}")
         
         # When apply_burn=False, caller has already applied per-campaign burn; use scores as final weights.
         if not apply_burn:
-            total = sum(miner_scores)
+            total = miner_scores.sum()
             if total > 0:
-                weights = [s / total for s in miner_scores]
+                weights = miner_scores / total
             else:
-                weights = [0.0] * len(uids)
+                weights = np.zeros(n_uids)
                 self._set_owner_weight_fallback(weights)
-            weights = self._round_weights(weights)
+            weights = self._round_weights(weights.tolist())
             logging.info(f"[blue]Setting weights for {scope} (pre-burned, no burn applied):[/blue] {weights}")
             success, message = self._set_weights(
                 wallet=self.wallet,
@@ -201,11 +290,11 @@ class ValidatorScoreSink(IScoreSink):
             burn_percentage = self.burn_percentage_resolver(scope)
         
         # Calculate weights before burn (normalized)
-        total = sum(miner_scores)
+        total = miner_scores.sum()
         if total > 0:
-            weights_before_burn = [s / total for s in miner_scores]
+            weights_before_burn = miner_scores / total
         else:
-            weights_before_burn = [0.0] * len(uids)
+            weights_before_burn = np.zeros(n_uids)
             self._set_owner_weight_fallback(weights_before_burn)
         
         # Apply creator burn if enabled
@@ -214,22 +303,12 @@ class ValidatorScoreSink(IScoreSink):
                 # Log weights before burn
                 logging.info(f"[yellow]Weights BEFORE burn ({burn_percentage}%) for scope {scope}:[/yellow] {weights_before_burn}")
                 
-                # Find owner UID externally
-                creator_uid = self._get_owner_uid()
-                final_uids, final_weights = apply_creator_burn(
-                    uids=uids,
-                    miner_scores=miner_scores,
-                    creator_uid=creator_uid,
-                    burn_percentage=burn_percentage,
-                )
-                
-                # Map final_weights back to metagraph.uids alignment
-                # (apply_creator_burn may return different UIDs, but we need to align to metagraph.uids)
-                weights_dict = dict(zip(final_uids, final_weights))
-                weights = [weights_dict.get(uid, 0.0) for uid in self.metagraph.uids]
+                # Find owner externally; the burn kernel works on metagraph.uids positions
+                creator_index = self._get_owner_index()
+                weights = apply_creator_burn_np(miner_scores, creator_index, burn_percentage)
                 
                 # If all weights are zero (all scores were zero), apply owner fallback
-                if sum(weights) == 0.0:
+                if not weights.any():
                     self._set_owner_weight_fallback(weights)
                 
                 # Log weights after burn
@@ -243,7 +322,7 @@ class ValidatorScoreSink(IScoreSink):
             # No burn: use weights_before_burn
             weights = weights_before_burn
 
-        weights = self._round_weights(weights)
+        weights = self._round_weights(weights.tolist())
         logging.info(f"[blue]Setting weights for {scope}:[/blue] {weights}")
         success, message = self._set_weights(
             wallet=self.wallet,
@@ -4,7 +4,7 @@ Factory for creating and validating Bittensor objects.
 Following Dependency Inversion Principle - depends on abstractions.
 Following Single Responsibility Principle - only responsible for object creation.
 """
-from typing import Optional
+from typing import List, Optional
 
 from bittensor.core.config import Config
 from bittensor.core.dendrite import Dendrite
@@ -42,6 +42,29 @@ class BittensorObjects:
         self.my_uid = my_uid
 
 
+class MetagraphSnapshot:
+    """
+    Minimal metagraph view built from ``subtensor.get_metagraph_info``.
+    
+    Exposes only the fields the validator and score sink consume
+    (``hotkeys`` and ``uids``), so it can stand in for a full Metagraph
+    between bootstrap syncs.
+    """
+    
+    def __init__(self, hotkeys: List[str], block: Optional[int] = None):
+        """
+        Initialize metagraph snapshot.
+        
+        Args:
+            hotkeys: Hotkey per UID, in UID order
+            block: Block at which the snapshot was taken (if known)
+        """
+        self.hotkeys = hotkeys
+        # UIDs are positional: the hotkey at index i belongs to UID i.
+        self.uids = list(range(len(hotkeys)))
+        self.block = block
+
+
 class BittensorFactory:
     """Factory for creating Bittensor objects."""
     
@@ -99,3 +122,27 @@ class BittensorFactory:
             my_uid=my_uid,
         )
 
+    @staticmethod
+    def fetch_metagraph_info(subtensor: Subtensor, netuid: int) -> Optional[MetagraphSnapshot]:
+        """
+        Fetch a lightweight metagraph snapshot via ``get_metagraph_info``.
+        
+        This runtime call is considerably cheaper than ``Metagraph.sync()``,
+        which pulls and post-processes every neuron field.
+        
+        Args:
+            subtensor: Bittensor subtensor connection
+            netuid: Subnet UID
+        
+        Returns:
+            MetagraphSnapshot, or None if the info could not be fetched
+        """
+        try:
+            info = subtensor.get_metagraph_info(netuid=netuid)
+        except Exception as e:
+            logging.warning(f"Failed to fetch metagraph info for subnet {netuid}: {e}")
+            return None
+        if info is None:
+            logging.warning(f"No metagraph info returned for subnet {netuid}")
+            return None
+        return MetagraphSnapshot(hotkeys=list(info.hotkeys), block=getattr(info, "block", None))
@@ -64,6 +64,8 @@ No validator updates or manual configuration required.
 """
 from typing import Optional
 
+import numpy as np
+
 
 def calculate_burn_percentage(
     emission_in_usd: float,
@@ -204,3 +206,47 @@ def get_burn_percentage_from_sales(
         # Log error and return None to disable burn
         return None
 
+
+def apply_creator_burn_np(
+    scores: np.ndarray,
+    creator_index: Optional[int],
+    burn_percentage: float,
+) -> np.ndarray:
+    """
+    Apply creator emissions burning to a score vector aligned to metagraph.uids.
+    
+    Array counterpart of bitads_v3_core's apply_creator_burn() for the case where the
+    creator is one of the scored UIDs: invalid (NaN, infinite, negative) scores count
+    as 0.0, miner scores are normalized excluding the creator, scaled by
+    (1 - burn), and the creator's slot receives the burn share.
+    
+    Args:
+        scores: Miner scores aligned to metagraph.uids
+        creator_index: Position of the creator/owner in scores (None skips the burn)
+        burn_percentage: Float in [0.0, 100.0], desired fraction of emissions to burn
+    
+    Returns:
+        New weight vector, same length as scores, summing to ~1.0 (all zeros if
+        no miner has a valid score)
+    
+    Example:
+        >>> apply_creator_burn_np(np.array([0.0, 1.0, 3.0]), 0, 50.0)
+        array([0.5  , 0.125, 0.375])
+    """
+    burn_prop = max(0.0, min(100.0, burn_percentage)) / 100.0
+    weights = np.where(np.isfinite(scores) & (scores > 0.0), scores, 0.0)
+    if creator_index is not None:
+        # The creator's weight represents the burn only, not its own miner score
+        weights[creator_index] = 0.0
+    
+    total = weights.sum()
+    if total <= 0.0:
+        return np.zeros(len(scores))
+    
+    if burn_prop == 0.0 or creator_index is None:
+        weights /= total
+        return weights
+    
+    weights *= (1.0 - burn_prop) / total
+    weights[creator_index] = burn_prop
+    return weights
@@ -43,6 +43,21 @@ DEFAULT_SALES_EMISSION_RATIO = 1.0  # 1:1 ratio (miners earn what they generate)
 # Resolver defaults
 DEFAULT_MECHID = 0  # Default mechanism ID if scope not found
 
+# Upper bound on worker threads used to compute campaign scores concurrently
+MAX_CAMPAIGN_WORKERS = 8
+
+# Repeated identical errors log a full traceback at most once per this many seconds
+ERROR_LOG_INTERVAL_SECONDS = 300
+
+# Upper bound on distinct scoring configurations kept as cached ScoreCalculators
+MAX_CACHED_SCORE_CALCULATORS = 32
+
+# Adaptive wait before the next weight update: while more than
+# POLL_MIN_BLOCKS_REMAINING blocks remain, sleep for this fraction of the
+# remaining time; closer to tempo, poll once per block
+DEFAULT_POLL_MULTIPLIER = 0.5
+POLL_MIN_BLOCKS_REMAINING = 4
+
 # Minimum score for pending miners (only pending orders, not in miner-stats)
 # so they receive a small weight and are not removed from the subnet
 PENDING_MINER_MIN_SCORE = 0.0001
\ No newline at end of file
@@ -4,6 +4,7 @@ Campaign domain model.
 Represents a campaign with its associated mechanism ID.
 """
 from dataclasses import dataclass
+from functools import cached_property
 
 
 @dataclass
@@ -16,6 +17,11 @@ class Campaign:
     # When None, the campaign will be treated as having no explicit split configured.
     emission_split: float | None = None
     
+    @cached_property
+    def mech_scope(self) -> str:
+        """Mechanism scope identifier for this campaign (e.g., "mech0")."""
+        return f"mech{self.mech_id}"
+    
     def __str__(self) -> str:
         return (
             f"Campaign(scope={self.scope}, mech_id={self.mech_id}, "
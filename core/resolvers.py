@@ -151,6 +151,9 @@ class WindowDaysGetter:
     Fetches window_days from external source dynamically.
     Window days are fetched for mechanism scope (mech_scope, e.g., "mech0", "mech1")
     because configuration is stored per mechanism in subnet_config.json.
+    
+    Resolved values are memoized per scope until clear_cache() is called, which
+    the validator does once per tempo.
     """
     
     def __init__(self, dynamic_config_source: IDynamicConfigSource):
@@ -161,6 +164,11 @@ class WindowDaysGetter:
             dynamic_config_source: Source for fetching dynamic configuration
         """
         self.dynamic_config_source = dynamic_config_source
+        self._cache: Dict[str, int] = {}
+    
+    def clear_cache(self) -> None:
+        """Forget memoized window days so the next call re-reads the config."""
+        self._cache.clear()
     
     def __call__(self, scope: str) -> int:
         """
@@ -172,6 +180,9 @@ class WindowDaysGetter:
         Returns:
             Window days (defaults to DEFAULT_WINDOW_DAYS if unavailable)
         """
+        window_days = self._cache.get(scope)
+        if window_days is not None:
+            return window_days
         config = self.dynamic_config_source.get_config(scope)
         window_days = config.window_days if config is not None else DEFAULT_WINDOW_DAYS
         from bittensor.utils.btlogging import logging
@@ -179,5 +190,6 @@ class WindowDaysGetter:
             logging.debug(f"WindowDaysGetter: mech_scope='{scope}', window_days={window_days} (from config)")
         else:
             logging.debug(f"WindowDaysGetter: mech_scope='{scope}', window_days={window_days} (default)")
+        self._cache[scope] = window_days
         return window_days
 
@@ -0,0 +1,97 @@
+"""
+Vectorized miner scoring.
+
+ScoreCalculator.score_many from bitads_v3_core scores miners one at a time and
+looks up the P95 percentiles for every miner. The subclass here keeps the same
+formulas (see bitads_v3_core.domain.math_ops) but resolves P95 once per call and
+evaluates them over NumPy arrays of the whole miner-stats window.
+"""
+from typing import List, Tuple
+
+import numpy as np
+
+from bitads_v3_core.app.scoring import ScoreCalculator
+from bitads_v3_core.domain.math_ops import EPS
+from bitads_v3_core.domain.models import MinerWindowStats, ScoreResult
+
+
+class VectorizedScoreCalculator(ScoreCalculator):
+    """
+    ScoreCalculator whose score_many evaluates all miners at once.
+
+    Produces the same ScoreResult values as the per-miner implementation
+    (up to floating-point rounding): sqrt/log1p normalization against P95,
+    weighted base score, refund multiplier and optional early-sales soft cap,
+    with zero-sales miners scoring 0.0. Negative sales, revenue or P95 values
+    raise the same ValueError as the math_ops helpers.
+    """
+
+    def score_many(
+        self,
+        entries: List[Tuple[str, MinerWindowStats]],
+        scope: str
+    ) -> List[ScoreResult]:
+        """
+        Compute scores for multiple miners.
+
+        Args:
+            entries: List of (miner_id, MinerWindowStats) tuples
+            scope: Opaque scope identifier
+
+        Returns:
+            List of ScoreResult objects, in the order of entries
+
+        Raises:
+            ValueError: If sales, revenue (for miners with sales) or P95 values are negative
+        """
+        n = len(entries)
+        if n == 0:
+            return []
+
+        # One pass over the entries into an (n, 3) array; the columns are views.
+        columns = np.array(
+            [(stats.sales, stats.revenue_usd, stats.refund_orders) for _, stats in entries],
+            dtype=np.float64,
+        )
+        sales, revenue, refunds = columns.T
+        # Same input checks as the math_ops helpers score_one goes through
+        if (sales < 0).any():
+            raise ValueError(f"sales must be >= 0, got {sales[sales < 0][0]}")
+
+        has_sales = sales > 0
+        # Refund rate: min(1, refund_orders / max(1, sales)), 0 for zero sales
+        ref = np.where(has_sales, np.clip(refunds / np.maximum(sales, 1.0), 0.0, 1.0), 0.0)
+        refund_multiplier = 1.0 - ref
+
+        base = np.zeros(n)
+        score = np.zeros(n)
+        # P95 is only needed (and only requested, as in score_one) when some miner has sales
+        if has_sales.any():
+            p = self.p95_provider.get_effective_p95(scope)
+            if p.p95_sales < 0:
+                raise ValueError(f"p95_sales must be >= 0, got {p.p95_sales}")
+            if p.p95_revenue_usd < 0:
+                raise ValueError(f"p95_rev must be >= 0, got {p.p95_revenue_usd}")
+            # Revenue is only normalized for miners with sales, as in score_one
+            negative_rev = has_sales & (revenue < 0)
+            if negative_rev.any():
+                raise ValueError(f"rev must be >= 0, got {revenue[negative_rev][0]}")
+            sales_norm = np.clip(np.sqrt(sales) / max(np.sqrt(p.p95_sales), EPS), 0.0, 1.0)
+            rev_norm = np.clip(np.log1p(revenue) / max(np.log1p(p.p95_revenue_usd), EPS), 0.0, 1.0)
+            base = np.where(
+                has_sales,
+                np.clip(self.w_sales * sales_norm + self.w_rev * rev_norm, 0.0, 1.0),
+                0.0,
+            )
+            score = np.clip(refund_multiplier * base, 0.0, 1.0)
+            if self.use_soft_cap:
+                score = np.where(
+                    sales < self.soft_cap_threshold,
+                    np.clip(score * self.soft_cap_factor, 0.0, 1.0),
+                    score,
+                )
+
+        return [
+            ScoreResult(miner_id=miner_id, base=b, refund_multiplier=m, score=s)
+            for (miner_id, _), b, m, s in zip(entries, base.tolist(), refund_multiplier.tolist(), score.tolist())
+        ]
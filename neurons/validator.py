@@ -1,8 +1,13 @@
 import argparse
+import collections
 import os
+import threading
 import time
-import traceback
-from typing import List
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from logging import INFO
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
 
 from bittensor.core.subtensor import Subtensor
 from bittensor.core import settings
@@ -12,8 +17,7 @@ from bittensor.core.settings import BLOCKTIME, NETWORKS
 from bittensor.utils.btlogging import logging
 
 from bitads_v3_core.app.scoring import ScoreCalculator
-from bitads_v3_core.domain.creator_burn import apply_creator_burn
-from bitads_v3_core.domain.models import ScoreResult
+from bitads_v3_core.domain.models import MinerWindowStats, ScoreResult
 
 from core import __version__, version_as_int
 from core.constants import (
@@ -31,22 +35,56 @@ from core.adapters.pending_miners_source import StoragePendingMinersSource
 from core.adapters.p95_provider import ValidatorP95Provider
 from core.adapters.score_sink import ValidatorScoreSink
 from core.adapters.burn_data_source import ValidatorBurnDataSource
-from core.adapters.dynamic_config_source import ValidatorDynamicConfigSource, StorageDynamicConfigSource, get_default_config
-from core.adapters.campaign_source import ValidatorCampaignSource, StorageCampaignSource, ICampaignSource
+from core.adapters.dynamic_config_source import DynamicConfig, ValidatorDynamicConfigSource, StorageDynamicConfigSource, get_default_config
+from core.adapters.campaign_source import ValidatorCampaignSource, StorageCampaignSource, CachedCampaignSource, ICampaignSource
 from core.bittensor_factory import BittensorFactory
+from core.burn_calculator import apply_creator_burn_np
+from core.scoring import VectorizedScoreCalculator
 from core.resolvers import MechIdResolver, BurnPercentageResolver, FixedBurnPercentageResolver, WindowDaysGetter
 from core.domain.campaign import Campaign
-from core.constants import DEFAULT_MECHID, PENDING_MINER_MIN_SCORE
+from core.constants import (
+    DEFAULT_MECHID,
+    DEFAULT_POLL_MULTIPLIER,
+    ERROR_LOG_INTERVAL_SECONDS,
+    MAX_CACHED_SCORE_CALCULATORS,
+    MAX_CAMPAIGN_WORKERS,
+    PENDING_MINER_MIN_SCORE,
+    POLL_MIN_BLOCKS_REMAINING,
+)
+
+def _info_enabled() -> bool:
+    """
+    Check whether INFO records are emitted by the bittensor logger.
+
+    The bittensor logger treats extra positional arguments as prefix/suffix,
+    so lazy ``%s`` formatting is not available; use this guard instead around
+    messages that are expensive to format (e.g. reprs of whole lists).
+    """
+    return logging.get_level() <= INFO
+
+
+class _NoopMetric:
+    """
+    Stand-in for a Prometheus metric when metrics are disabled.
+
+    Supports the subset of the Counter/Gauge/Histogram API the validator uses,
+    so metric call sites need no enabled/disabled checks.
+    """
+
+    def inc(self, *args, **kwargs) -> None:
+        pass
+
+    def observe(self, *args, **kwargs) -> None:
+        pass
 
-try:
-    # Optional Prometheus support for metrics exporting.
-    # If prometheus_client is not installed, metrics are simply disabled.
-    from prometheus_client import Counter, Gauge, Histogram, start_http_server
+    def set(self, *args, **kwargs) -> None:
+        pass
 
-    _PROMETHEUS_AVAILABLE = True
-except ImportError:
-    Counter = Gauge = Histogram = start_http_server = None  # type: ignore
-    _PROMETHEUS_AVAILABLE = False
+    def labels(self, *args, **kwargs) -> "_NoopMetric":
+        return self
+
+
+_NOOP_METRIC = _NoopMetric()
 
 
 class Validator:
@@ -71,8 +109,11 @@ class Validator:
         self.wallet = bt_objects.wallet
         self.subtensor = bt_objects.subtensor
         self.metagraph = bt_objects.metagraph
+        # Full metagraph from bootstrap; only re-synced if get_metagraph_info fails.
+        self._bootstrap_metagraph = bt_objects.metagraph
         self.dendrite = bt_objects.dendrite
         self.my_uid = bt_objects.my_uid
+        self._refresh_hotkeys_snapshot()
         # Stable identifier for this validator instance (used in metrics labels).
         try:
             self.hotkey_address = self.wallet.hotkey.ss58_address  # type: ignore[attr-defined]
@@ -84,6 +125,7 @@ class Validator:
         # Prometheus entirely, so we don't start a metrics HTTP server for
         # local/utility runs.
         self._metrics_enabled = enable_metrics
+        self._init_noop_metrics()
         if self._metrics_enabled:
             self._setup_metrics()
         
@@ -94,9 +136,82 @@ class Validator:
         )
         self.tempo = self.subtensor.tempo(self.config.netuid)
         
+        # Per-cycle mech_scope -> DynamicConfig map, filled by one bulk lookup
+        # at the start of _process_weights and emptied when it returns.
+        self._scope_configs = {}
+        # Scoring parameters -> ScoreCalculator, shared by every scope with the
+        # same configuration (oldest entries evicted beyond MAX_CACHED_SCORE_CALCULATORS).
+        self._score_calculators: dict[tuple, ScoreCalculator] = {}
+        # (source, exception type) -> monotonic time its traceback was last logged.
+        self._error_log_times: dict[Tuple[str, str], float] = {}
+        # campaign scope -> pending-only miner hotkeys, fetched once per cycle.
+        self._pending_miners_cache: dict[str, frozenset[str]] = {}
+        
+        # Worker pools live for the validator's lifetime rather than per cycle and
+        # are shut down when run() exits (one-off callers call _shutdown_pools()).
+        # The burn pool has a single thread so its subtensor queries never overlap.
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=MAX_CAMPAIGN_WORKERS, thread_name_prefix="validator-io"
+        )
+        self._burn_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="validator-burn")
+        # Miner stats fetched in the background while waiting for the last blocks
+        # before a weight update; resolves to {(scope, window_days): stats}.
+        self._prefetch_future: Optional[Future] = None
+        
         # Initialize core interfaces
         self._initialize_core_components()   
 
+    def _sync_metagraph(self) -> None:
+        """
+        Refresh the metagraph view used for scoring and weight setting.
+        
+        Uses ``get_metagraph_info`` (hotkeys/uids only) instead of a full
+        ``metagraph.sync()``; falls back to syncing the bootstrap metagraph
+        if the runtime call is unavailable.
+        """
+        snapshot = BittensorFactory.fetch_metagraph_info(self.subtensor, self.config.netuid)
+        if snapshot is not None:
+            self.metagraph = snapshot
+        else:
+            self._bootstrap_metagraph.sync()
+            self.metagraph = self._bootstrap_metagraph
+        # The score sink maps hotkeys to UIDs and must see the same view.
+        self.score_sink.metagraph = self.metagraph
+        self._refresh_hotkeys_snapshot()
+
+    def _refresh_hotkeys_snapshot(self) -> None:
+        """
+        Snapshot metagraph hotkeys for the current cycle.
+
+        ``metagraph.hotkeys`` is re-read through the metagraph on every access;
+        taking one copy per sync keeps the view consistent across all campaigns
+        processed in the cycle, and the hotkey -> index map gives O(1) membership
+        checks and lookups. The UIDs are copied into a plain int list alongside, since
+        indexing ``metagraph.uids`` yields array scalars. Everything is only rebuilt
+        when the hotkeys changed.
+        """
+        hotkeys = tuple(self.metagraph.hotkeys)
+        if hotkeys == getattr(self, "_hotkeys_snapshot", None):
+            return
+        self._hotkeys_snapshot = hotkeys
+        self._uids_list = [int(uid) for uid in self.metagraph.uids]
+        self._hotkey_to_index = {hotkey: index for index, hotkey in enumerate(hotkeys)}
+        # zip stops at the shorter sequence, so hotkeys without a UID are left out.
+        self._hotkey_to_uid = dict(zip(hotkeys, self._uids_list))
+
+    def _init_noop_metrics(self) -> None:
+        """Point every metric at a no-op; _setup_metrics replaces them when enabled."""
+        self.metric_loop_iterations = _NOOP_METRIC
+        self.metric_sync_and_process_duration = _NOOP_METRIC
+        self.metric_last_process_success = _NOOP_METRIC
+        self.metric_active_campaigns = _NOOP_METRIC
+        self.metric_weights_sets_total = _NOOP_METRIC
+        self.metric_weights_errors_total = _NOOP_METRIC
+        self.metric_version = _NOOP_METRIC
+        # Labeled children of the per-scope counters, bound once per scope.
+        self._metric_weights_sets_by_scope = {}
+        self._metric_weights_errors_by_scope = {}
+
     def _setup_metrics(self) -> None:
         """
         Optionally start Prometheus metrics exporter and register core metrics.
@@ -107,14 +222,6 @@ class Validator:
         
         If prometheus_client is not available, metrics are disabled gracefully.
         """
-        self.metric_loop_iterations = None
-        self.metric_sync_and_process_duration = None
-        self.metric_last_process_success = None
-        self.metric_active_campaigns = None
-        self.metric_weights_sets_total = None
-        self.metric_weights_errors_total = None
-        self.metric_version = None
-
         # Allow operators to disable telemetry completely via config flag.
         # When disabled, we skip metrics and do not serve the axon.
         if getattr(self.config, "disable_telemetry", False):
@@ -131,7 +238,12 @@ class Validator:
             logging.warning(f"Invalid axon.port value '{raw_port}', metrics disabled.")
             return
 
-        if not _PROMETHEUS_AVAILABLE:
+        try:
+            # Optional Prometheus support for metrics exporting, imported only once
+            # metrics are actually requested so telemetry-disabled runs skip it.
+            # If prometheus_client is not installed, metrics are simply disabled.
+            from prometheus_client import Counter, Gauge, Histogram, start_http_server
+        except ImportError:
             logging.warning(
                 "Prometheus metrics requested but prometheus_client is not installed. "
                 "Install prometheus_client to enable metrics or use --disable-telemetry."
@@ -140,13 +252,15 @@ class Validator:
 
         try:
             start_http_server(port)
-            axon = Axon(wallet=self.wallet, config=self.config)
-            self.subtensor.serve_axon(self.config.netuid, axon)
             logging.info(f"Started Prometheus metrics server on port {port}")
         except Exception as e:
             logging.warning(f"Failed to start Prometheus metrics server on port {port}: {e}")
             return
 
+        # Announcing the axon is a chain extrinsic that can take seconds; do it in
+        # the background so startup does not wait on it.
+        threading.Thread(target=self._serve_axon, name="validator-serve-axon", daemon=True).start()
+
         # Core process metrics
         self.metric_loop_iterations = Counter(
             "validator_loop_iterations_total",
@@ -191,6 +305,73 @@ class Validator:
         # Set the version value
         self.metric_version.set(version_as_int)
     
+    def _serve_axon(self) -> None:
+        """
+        Announce the axon (and thereby the metrics port) on chain.
+        
+        Runs on a background thread with its own subtensor connection, since the
+        validator's connection must not be used from two threads at once.
+        """
+        subtensor = None
+        try:
+            axon = Axon(wallet=self.wallet, config=self.config)
+            subtensor = Subtensor(config=self.config)
+            subtensor.serve_axon(self.config.netuid, axon)
+            logging.info(f"Served axon on port {axon.port}")
+        except Exception as e:
+            logging.warning(f"Failed to serve axon: {e}")
+        finally:
+            # The connection is only needed for this one extrinsic.
+            if subtensor is not None:
+                subtensor.close()
+
+    def _shutdown_pools(self) -> None:
+        """Shut down the worker pools without waiting for queued work."""
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self._burn_pool.shutdown(wait=False, cancel_futures=True)
+
+    def _log_error(self, source: str, message: str, error: Exception) -> None:
+        """
+        Log an error as a single record, attaching the traceback at most once per interval.
+        
+        Repeats of the same error type from the same source within
+        ``ERROR_LOG_INTERVAL_SECONDS`` are logged as one line without the traceback,
+        so a campaign that fails every cycle does not flood the logs with frames.
+        
+        Args:
+            source: What failed (e.g. "loop" or a campaign scope)
+            message: Log message
+            error: The exception being reported
+        """
+        key = (source, type(error).__name__)
+        now = time.monotonic()
+        last_logged = self._error_log_times.get(key)
+        if last_logged is None or now - last_logged >= ERROR_LOG_INTERVAL_SECONDS:
+            self._error_log_times[key] = now
+            logging.error(message, exc_info=error)
+        else:
+            logging.error(f"{message} (repeated; traceback suppressed)")
+
+    def _scoped_metric(self, metric, children: dict, scope: str):
+        """
+        Get the child of a (hotkey, scope)-labeled metric, binding it on first use.
+        
+        ``metric.labels(...)`` hashes the label values and takes the metric's lock
+        on every call, so the bound child is kept per scope instead.
+        
+        Args:
+            metric: Labeled Prometheus metric (labels: hotkey, scope)
+            children: Cache of bound children for this metric, keyed by scope
+            scope: Scope label value
+        
+        Returns:
+            Bound child metric for this validator's hotkey and the scope
+        """
+        child = children.get(scope)
+        if child is None:
+            child = children[scope] = metric.labels(hotkey=self.hotkey_address, scope=scope)
+        return child
+    
     def _initialize_core_components(self):
         """Initialize all core components following dependency injection."""
         # Get network from config
@@ -199,9 +380,6 @@ class Validator:
         # Dynamic config source (for window_days, sales_emission_ratio, p95_config)
         self.dynamic_config_source = StorageDynamicConfigSource(network=network)
         
-        # Campaign source (for fetching campaigns with mech_ids)
-        self.campaign_source = StorageCampaignSource(network=network)
-        
         # Config source (delegates to dynamic_config_source for P95)
         self.config_source = ValidatorConfigSource(
             dynamic_config_source=self.dynamic_config_source
@@ -209,41 +387,36 @@ class Validator:
         self.miner_stats_source = StorageMinerStatsSource(network=network)
         self.pending_miners_source = StoragePendingMinersSource(network=network)
 
-        # Build mapping from mech_scope to campaign_scope for P95 provider.
-        # This allows P95 provider to fetch miner stats using campaign_id when
-        # scope is mech_scope. If multiple campaigns share the same mech_id we
-        # keep the first campaign as the "primary" source for P95.
-        campaigns = self.campaign_source.get_campaigns()
-        mech_scope_to_campaign_scope: dict[str, str] = {}
-        for campaign in campaigns:
-            mech_scope = f"mech{campaign.mech_id}"
-            if mech_scope not in mech_scope_to_campaign_scope:
-                mech_scope_to_campaign_scope[mech_scope] = campaign.scope
-        logging.info(
-            f"Built mech_scope -> primary campaign_scope mapping for P95: "
-            f"{mech_scope_to_campaign_scope}"
-        )
-        
+        # The mech_scope -> campaign_scope mapping is filled in whenever the
+        # campaign source (re)loads campaigns, see _on_campaigns_refreshed.
         self.p95_provider = ValidatorP95Provider(
             config_source=self.config_source,
             miner_stats_source=self.miner_stats_source,
             dynamic_config_source=self.dynamic_config_source,
-            mech_scope_to_campaign_scope=mech_scope_to_campaign_scope,
         )
         
-        # Window days getter (fetches from dynamic_config_source per scope)
-        window_days_getter = WindowDaysGetter(self.dynamic_config_source)
+        # Campaign source (for fetching campaigns with mech_ids). Campaigns rarely
+        # change within a tempo, so cache them for half a tempo.
+        self.campaign_source = CachedCampaignSource(
+            StorageCampaignSource(network=network),
+            ttl=self.tempo * BLOCKTIME / 2,
+            on_refresh=self._on_campaigns_refreshed,
+        )
+        self.campaign_source.get_campaigns()
+        
+        # Window days getter (fetches from dynamic_config_source per scope, memoized per tempo)
+        self.window_days_getter = WindowDaysGetter(self.dynamic_config_source)
         
-        # Sales emission ratio getter (fetches from dynamic_config_source per scope)
+        # Sales emission ratio getter (reads this cycle's scope configs, else dynamic_config_source)
         def sales_emission_ratio_getter(scope: str):
-            config = self.dynamic_config_source.get_config(scope)
+            config = self._get_scope_config(scope)
             return config.sales_emission_ratio if config is not None else None
         
         # Burn data source
         self.burn_data_source = ValidatorBurnDataSource(
             subtensor=self.subtensor,
             netuid=self.config.netuid,
-            window_days_getter=window_days_getter,
+            window_days_getter=self.window_days_getter,
             sales_emission_ratio_getter=sales_emission_ratio_getter,
             miner_stats_source=self.miner_stats_source,
         )
@@ -277,7 +450,7 @@ class Validator:
                 return self._global_fixed_burn_resolver(scope)
 
             # 2. Per-scope fixed burn percentage from dynamic config
-            scope_config = self.dynamic_config_source.get_config(scope)
+            scope_config = self._get_scope_config(scope)
             if scope_config is not None and scope_config.burn_percentage is not None:
                 # Use FixedBurnPercentageResolver for this scope when burn_percentage is set
                 return FixedBurnPercentageResolver(scope_config.burn_percentage)(scope)
@@ -300,6 +473,43 @@ class Validator:
         # Score calculator is now created dynamically per-scope in set_weights_for_scope
         # to use scope-specific configuration (use_soft_cap, use_flooring, weights, etc.)
 
+    def _on_campaigns_refreshed(self, campaigns: List[Campaign]) -> None:
+        """
+        Update campaign-derived mappings after the campaign source refetches.
+        
+        Builds the mapping from mech_scope to campaign_scope for the P95 provider.
+        This allows P95 provider to fetch miner stats using campaign_id when
+        scope is mech_scope. If multiple campaigns share the same mech_id we
+        keep the first campaign as the "primary" source for P95.
+        
+        Args:
+            campaigns: Freshly fetched list of active campaigns
+        """
+        mech_scope_to_campaign_scope: dict[str, str] = {}
+        for campaign in campaigns:
+            mech_scope = campaign.mech_scope
+            if mech_scope not in mech_scope_to_campaign_scope:
+                mech_scope_to_campaign_scope[mech_scope] = campaign.scope
+        if self.p95_provider.update_mech_scope_mapping(mech_scope_to_campaign_scope):
+            logging.info(
+                f"Built mech_scope -> primary campaign_scope mapping for P95: "
+                f"{mech_scope_to_campaign_scope}"
+            )
+
+    def _get_scope_config(self, scope: str) -> Optional[DynamicConfig]:
+        """
+        Get dynamic config for a mechanism scope, preferring this cycle's bulk lookup.
+        
+        Args:
+            scope: Mechanism scope identifier (e.g., "mech0", "mech1")
+        
+        Returns:
+            DynamicConfig for the scope, or None if unavailable
+        """
+        if scope in self._scope_configs:
+            return self._scope_configs[scope]
+        return self.dynamic_config_source.get_config(scope)
+
     def _get_config(self) -> Config:
         """Get Bittensor configuration."""
         parser = argparse.ArgumentParser()
@@ -318,6 +528,12 @@ class Validator:
             action="store_true",
             help="Disable Prometheus metrics / telemetry (enabled by default).",
         )
+        parser.add_argument(
+            "--poll-multiplier",
+            type=float,
+            default=DEFAULT_POLL_MULTIPLIER,
+            help="Fraction (0.0-1.0] of the remaining time until the next weight update to sleep before re-checking the chain. Close to tempo the validator polls once per block.",
+        )
       
         Subtensor.add_args(parser)
         Wallet.add_args(parser)
@@ -330,6 +546,11 @@ class Validator:
         if config.subtensor.chain_endpoint != settings.DEFAULTS.subtensor.chain_endpoint:
             config.subtensor.network = None
         
+        if not 0.0 < config.poll_multiplier <= 1.0:
+            raise ValueError(
+                f"poll_multiplier must be in (0.0, 1.0], got {config.poll_multiplier}"
+            )
+        
         # Validate burn percentage override if provided
         if config.burn_percentage_override is not None:
             if config.burn_percentage_override < 0.0 or config.burn_percentage_override > 100.0:
@@ -364,44 +585,121 @@ class Validator:
         """
         return self.campaign_source.get_campaigns()
     
-    def compute_scores_for_campaign(self, campaign: Campaign, score_calculator: ScoreCalculator) -> List[ScoreResult]:
+    def _get_score_calculator(self, scope_config: DynamicConfig) -> ScoreCalculator:
+        """
+        Get a ScoreCalculator configured from a scope's configuration.
+        
+        Calculators hold no per-scope state (the scope is passed to score_many),
+        so they are cached by their scoring parameters and shared across scopes.
+        
+        Args:
+            scope_config: Resolved configuration for the scope
+        
+        Returns:
+            ScoreCalculator for the configuration
+        """
+        key = (
+            scope_config.use_soft_cap,
+            scope_config.use_flooring,
+            scope_config.w_sales,
+            scope_config.w_rev,
+            scope_config.soft_cap_threshold,
+            scope_config.soft_cap_factor,
+        )
+        score_calculator = self._score_calculators.get(key)
+        if score_calculator is not None:
+            return score_calculator
+
+        score_calculator = VectorizedScoreCalculator(
+            p95_provider=self.p95_provider,
+            use_soft_cap=scope_config.use_soft_cap,
+            use_flooring=scope_config.use_flooring,
+            w_sales=scope_config.w_sales,
+            w_rev=scope_config.w_rev,
+            soft_cap_threshold=scope_config.soft_cap_threshold,
+            soft_cap_factor=scope_config.soft_cap_factor,
+        )
+        if len(self._score_calculators) >= MAX_CACHED_SCORE_CALCULATORS:
+            # Dicts keep insertion order, so the first key is the oldest entry.
+            self._score_calculators.pop(next(iter(self._score_calculators)), None)
+        self._score_calculators[key] = score_calculator
+        return score_calculator
+
+    def _get_pending_miners(self, campaign_scope: str) -> frozenset[str]:
+        """
+        Get pending-only miners for a campaign, fetching them at most once per cycle.
+        
+        Args:
+            campaign_scope: Campaign scope identifier (campaign_id)
+        
+        Returns:
+            Frozen set of pending miner hotkeys
+        """
+        pending_miners = self._pending_miners_cache.get(campaign_scope)
+        if pending_miners is None:
+            pending_miners = frozenset(self.pending_miners_source.get_pending_miners(campaign_scope))
+            self._pending_miners_cache[campaign_scope] = pending_miners
+        return pending_miners
+
+    def fetch_miner_stats_for_campaign(self, campaign: Campaign) -> List[Tuple[str, MinerWindowStats]]:
+        """
+        Fetch the miner stats window for a given campaign.
+        
+        Args:
+            campaign: Campaign object with scope and mech_id
+        
+        Returns:
+            List of (miner_id, MinerWindowStats) tuples
+        """
+        mech_scope = campaign.mech_scope
+        # Fetch miner statistics using campaign scope (campaign_id)
+        # Window days should be fetched for mech_scope (config is stored per mechanism, not per campaign)
+        window_days = self.burn_data_source.window_days_getter(mech_scope)
+        logging.info(f"Fetching miner stats: campaign_scope={campaign.scope}, window_days={window_days} (from mech_scope={mech_scope})")
+        return self.miner_stats_source.fetch_window(campaign.scope, window_days)
+
+    def compute_scores_for_campaign(
+        self,
+        campaign: Campaign,
+        score_calculator: ScoreCalculator,
+        miner_stats_list: Optional[List[Tuple[str, MinerWindowStats]]] = None,
+    ) -> List[ScoreResult]:
         """
         Compute scores for all miners for a given campaign.
         
+        Does not touch the P95 provider's miner-stats cache: campaigns are scored
+        concurrently and share it, so callers seed it before scoring starts.
+        
         Args:
             campaign: Campaign object with scope and mech_id
             score_calculator: ScoreCalculator instance configured for this campaign
+            miner_stats_list: Miner stats already fetched for this campaign; fetched
+                here when not provided
         
         Returns:
             List of ScoreResult entries
         """
-        mech_scope = f"mech{campaign.mech_id}"
+        mech_scope = campaign.mech_scope
         
         logging.info(f"Computing scores: campaign_id={campaign.scope}, mech_id={campaign.mech_id}, mech_scope={mech_scope}")
         
-        # Fetch miner statistics using campaign scope (campaign_id)
-        # Window days should be fetched for mech_scope (config is stored per mechanism, not per campaign)
-        window_days = self.burn_data_source.window_days_getter(mech_scope)
-        logging.info(f"Fetching miner stats: campaign_scope={campaign.scope}, window_days={window_days} (from mech_scope={mech_scope})")
-        miner_stats_list = self.miner_stats_source.fetch_window(campaign.scope, window_days)
+        if miner_stats_list is None:
+            miner_stats_list = self.fetch_miner_stats_for_campaign(campaign)
         
         if not miner_stats_list:
             logging.warning(f"No miner stats found for campaign {campaign.scope}, using zero scores")
-            # Start with zero for all; pending-only miners get minimum score
+            # Miners missing from the results already score 0.0 downstream, so only
+            # pending-only miners (minimum score) need explicit entries.
+            pending_miners = self._get_pending_miners(campaign.scope)
             score_results = [
-                ScoreResult(miner_id=hotkey, base=0.0, refund_multiplier=1.0, score=0.0)
-                for hotkey in self.metagraph.hotkeys
+                ScoreResult(
+                    miner_id=hotkey,
+                    base=PENDING_MINER_MIN_SCORE,
+                    refund_multiplier=1.0,
+                    score=PENDING_MINER_MIN_SCORE,
+                )
+                for hotkey in pending_miners & self._hotkey_to_index.keys()
             ]
-            pending_miners = self.pending_miners_source.get_pending_miners(campaign.scope)
-            for hotkey in pending_miners:
-                if hotkey in self.metagraph.hotkeys:
-                    idx = self.metagraph.hotkeys.index(hotkey)
-                    score_results[idx] = ScoreResult(
-                        miner_id=hotkey,
-                        base=PENDING_MINER_MIN_SCORE,
-                        refund_multiplier=1.0,
-                        score=PENDING_MINER_MIN_SCORE,
-                    )
             if pending_miners:
                 logging.info(
                     f"Assigned minimum score ({PENDING_MINER_MIN_SCORE}) to "
@@ -411,11 +709,8 @@ class Validator:
 
         logging.info(f"Fetched {len(miner_stats_list)} miner stats for campaign_scope={campaign.scope}, computing scores with mech_scope={mech_scope}")
         
-        # Cache miner stats in P95 provider to avoid duplicate fetch in AUTO mode
-        self.p95_provider.set_miner_stats_cache(campaign.scope, miner_stats_list)
-        
         # Compute scores using ScoreCalculator
-        # P95 provider will use cached miner stats if needed (AUTO mode)
+        # P95 provider uses the miner stats cached by the caller if needed (AUTO mode)
         score_results = score_calculator.score_many(miner_stats_list, mech_scope)
         logging.info(f"Computed {len(score_results)} scores for mech_scope={mech_scope}")
 
@@ -423,28 +718,22 @@ class Validator:
         # so they are not removed from the subnet. A miner is either on the pending
         # list or in miner-stats for this campaign, not both.
         miners_with_score = {r.miner_id for r in score_results}
-        pending_miners = self.pending_miners_source.get_pending_miners(campaign.scope)
-        for hotkey in pending_miners:
-            if hotkey not in miners_with_score and hotkey in self.metagraph.hotkeys:
-                score_results.append(
-                    ScoreResult(
-                        miner_id=hotkey,
-                        base=PENDING_MINER_MIN_SCORE,
-                        refund_multiplier=1.0,
-                        score=PENDING_MINER_MIN_SCORE,
-                    )
+        pending_miners = self._get_pending_miners(campaign.scope)
+        for hotkey in (pending_miners & self._hotkey_to_index.keys()) - miners_with_score:
+            score_results.append(
+                ScoreResult(
+                    miner_id=hotkey,
+                    base=PENDING_MINER_MIN_SCORE,
+                    refund_multiplier=1.0,
+                    score=PENDING_MINER_MIN_SCORE,
                 )
-                miners_with_score.add(hotkey)
+            )
         if pending_miners and len(score_results) > len(miner_stats_list):
             logging.info(
                 f"Added minimum score ({PENDING_MINER_MIN_SCORE}) for "
                 f"{len(score_results) - len(miner_stats_list)} pending-only miners in campaign {campaign.scope}"
             )
         
-        # Clear miner stats cache for this campaign after processing is complete
-        # This ensures we fetch fresh stats on the next iteration
-        self.p95_provider.clear_miner_stats_cache(campaign.scope)
-        
         return score_results
     
     def set_weights_for_campaign(self, campaign: Campaign) -> None:
@@ -457,73 +746,237 @@ class Validator:
         Args:
             campaign: Campaign object with scope and mech_id
         """
-        mech_scope = f"mech{campaign.mech_id}"
+        mech_scope = campaign.mech_scope
         
         logging.info(f"Computing scores for campaign: {campaign.scope} (mech_id: {campaign.mech_id}, mech_scope: {mech_scope})")
         
         # Get scope-specific configuration using mech_scope (for new API format)
-        scope_config = self.dynamic_config_source.get_config(mech_scope)
+        scope_config = self._get_scope_config(mech_scope)
         if scope_config is None:
             logging.warning(f"No configuration found for mech_scope {mech_scope}, using defaults")
             scope_config = get_default_config(mech_scope)
         else:
             logging.info(f"Using config for mech_scope={mech_scope}: use_soft_cap={scope_config.use_soft_cap}, use_flooring={scope_config.use_flooring}, w_sales={scope_config.w_sales}, w_rev={scope_config.w_rev}")
         
-        # Create ScoreCalculator with scope-specific configuration
-        score_calculator = ScoreCalculator(
-            p95_provider=self.p95_provider,
-            use_soft_cap=scope_config.use_soft_cap,
-            use_flooring=scope_config.use_flooring,
-            w_sales=scope_config.w_sales,
-            w_rev=scope_config.w_rev,
-            soft_cap_threshold=scope_config.soft_cap_threshold,
-            soft_cap_factor=scope_config.soft_cap_factor,
-        )
+        # Reuse the ScoreCalculator cached for this configuration
+        score_calculator = self._get_score_calculator(scope_config)
         
-        # Compute scores for this campaign
-        score_results = self.compute_scores_for_campaign(campaign, score_calculator)
+        # Compute scores for this campaign. Cache its miner stats in the P95 provider
+        # to avoid a duplicate fetch in AUTO mode, and clear them once scored so the
+        # next iteration fetches fresh stats.
+        miner_stats_list = self.fetch_miner_stats_for_campaign(campaign)
+        self.p95_provider.set_miner_stats_cache(campaign.scope, miner_stats_list)
+        try:
+            score_results = self.compute_scores_for_campaign(campaign, score_calculator, miner_stats_list)
+        finally:
+            self.p95_provider.clear_miner_stats_cache(campaign.scope)
         # Delegate publishing (which sets weights) to the score sink.
         # Empty score_results -> sink uses burn (owner only). If we have results but set_weights fails, leave as is.
-        success, message = self.score_sink.publish(score_results, mech_scope, miner_stats_scope=campaign.scope)
+        success, message = self.score_sink.publish(
+            score_results,
+            mech_scope,
+            miner_stats_scope=campaign.scope,
+            hotkey_to_index=self._hotkey_to_index,
+        )
         if not success:
             logging.warning(f"Set weights failed for campaign {campaign.scope}; leaving weights as is: {message}")
     
     def run(self):
         """Main validation loop."""
         logging.info("Starting validator loop.")
-        while True:
-            try:
-                if getattr(self, "metric_loop_iterations", None) is not None:
+        try:
+            while True:
+                try:
                     self.metric_loop_iterations.inc()
 
-                start_time = time.time()
-                self._sync_and_process()
-                duration = time.time() - start_time
+                    start_time = time.time()
+                    self._sync_and_process()
+                    duration = time.time() - start_time
 
-                if getattr(self, "metric_sync_and_process_duration", None) is not None:
                     self.metric_sync_and_process_duration.observe(duration)
-                if getattr(self, "metric_last_process_success", None) is not None:
                     self.metric_last_process_success.set(1.0)
-            except RuntimeError as e:
-                logging.error(f"Runtime error in validator loop: {e}")
-                traceback.print_exc()
-                if getattr(self, "metric_last_process_success", None) is not None:
+                except RuntimeError as e:
+                    self._log_error("loop", f"Runtime error in validator loop: {e}", e)
+                    self._scoped_metric(
+                        self.metric_weights_errors_total,
+                        self._metric_weights_errors_by_scope,
+                        "loop",
+                    ).inc()
                     self.metric_last_process_success.set(0.0)
-            except KeyboardInterrupt:
-                logging.success("Keyboard interrupt detected. Exiting validator.")
-                break
+                except KeyboardInterrupt:
+                    logging.success("Keyboard interrupt detected. Exiting validator.")
+                    break
+        finally:
+            self._shutdown_pools()
     
     def _sync_and_process(self):
         """Sync metagraph and process weights if needed."""
-        self.metagraph.sync()
-        
         if self.last_update >= self.tempo:
+            # Only the weights path reads the metagraph, so skip the sync on
+            # iterations that just sleep until the next update.
+            self._sync_metagraph()
             self._process_weights()
             self.p95_provider.update_percentiles()
             self.last_update = 0
         else:
             self._sleep_until_next_update()
     
+    def _compute_campaign_scores(
+        self,
+        campaign: Campaign,
+        miner_stats_list: List[Tuple[str, MinerWindowStats]],
+    ) -> Tuple[np.ndarray, Set[int]]:
+        """
+        Compute the UID-aligned score vector for a single campaign.
+        
+        Runs on a worker thread from ``_process_weights``, so it only reads shared
+        validator state and returns its results instead of mutating them.
+        
+        Args:
+            campaign: Campaign object with scope and mech_id
+            miner_stats_list: Miner stats prefetched for this campaign
+        
+        Returns:
+            Tuple of (scores aligned to metagraph.uids, hotkey indices of miners
+            that received the pending minimum score)
+        """
+        mech_scope = campaign.mech_scope
+        logging.info(
+            f"Computing scores for aggregation: campaign_scope={campaign.scope}, "
+            f"mech_id={campaign.mech_id}, mech_scope={mech_scope}"
+        )
+
+        # Get scope-specific configuration using mech_scope.
+        scope_config = self._get_scope_config(mech_scope)
+        if scope_config is None:
+            logging.warning(f"No configuration found for mech_scope {mech_scope}, using defaults")
+            scope_config = get_default_config(mech_scope)
+        elif _info_enabled():
+            logging.info(
+                f"Using config for mech_scope={mech_scope}: "
+                f"use_soft_cap={scope_config.use_soft_cap}, "
+                f"use_flooring={scope_config.use_flooring}, "
+                f"w_sales={scope_config.w_sales}, w_rev={scope_config.w_rev}"
+            )
+
+        # Reuse the ScoreCalculator cached for this configuration.
+        score_calculator = self._get_score_calculator(scope_config)
+
+        # Compute scores for this campaign.
+        score_results = self.compute_scores_for_campaign(campaign, score_calculator, miner_stats_list)
+
+        # Miners that got the pending minimum; their final weight is left as-is.
+        pending_indices: Set[int] = set()
+        pending_miners_this = self._get_pending_miners(campaign.scope)
+        for r in score_results:
+            if (
+                r.score == PENDING_MINER_MIN_SCORE
+                and r.miner_id in pending_miners_this
+                and r.miner_id in self._hotkey_to_index
+            ):
+                pending_indices.add(self._hotkey_to_index[r.miner_id])
+
+        # Scatter scores into a vector aligned to the UID list (miner_id is hotkey;
+        # a hotkey's index is its UID position).
+        miner_scores = np.zeros(len(self._uids_list))
+        for result in score_results:
+            if result.miner_id in self._hotkey_to_uid:
+                miner_scores[self._hotkey_to_index[result.miner_id]] = result.score
+        return miner_scores, pending_indices
+
+    def _compute_campaign_weights(
+        self,
+        campaign: Campaign,
+        miner_stats_list: List[Tuple[str, MinerWindowStats]],
+        burn_future: Optional[Future],
+        owner_index: Optional[int],
+    ) -> Tuple[np.ndarray, Set[int]]:
+        """
+        Compute a campaign's normalized, burn-adjusted weight vector.
+        
+        Runs on a worker thread from ``_process_weights``; only the emission-weighted
+        aggregation of the returned vectors is left to the calling thread.
+        
+        Args:
+            campaign: Campaign object with scope and mech_id
+            miner_stats_list: Miner stats prefetched for this campaign
+            burn_future: Future resolving to the campaign's burn percentage, if any
+            owner_index: Subnet owner's position in the UID list (the burn's recipient)
+        
+        Returns:
+            Tuple of (weights aligned to the UID list, hotkey indices of miners
+            that received the pending minimum score)
+        """
+        mech_scope = campaign.mech_scope
+        uids = self._uids_list
+        miner_scores, pending_indices = self._compute_campaign_scores(campaign, miner_stats_list)
+
+        # Apply this campaign's burn_percentage (per mechanism/company config).
+        burn_percentage = burn_future.result() if burn_future is not None else None
+
+        if burn_percentage is not None and burn_percentage > 0.0:
+            try:
+                campaign_weights_vec = apply_creator_burn_np(miner_scores, owner_index, burn_percentage)
+                if not campaign_weights_vec.any():
+                    if owner_index is not None:
+                        campaign_weights_vec = np.zeros(len(uids))
+                        campaign_weights_vec[owner_index] = 1.0
+                logging.info(
+                    f"Applied burn {burn_percentage}% for campaign {campaign.scope} (mech_scope={mech_scope})"
+                )
+            except Exception as e:
+                logging.warning(
+                    f"Failed to apply creator burn for campaign {campaign.scope}: {e}, using normalized scores"
+                )
+                campaign_weights_vec = self._normalize_or_owner(miner_scores, owner_index)
+        else:
+            campaign_weights_vec = self._normalize_or_owner(miner_scores, owner_index)
+
+        return campaign_weights_vec, pending_indices
+
+    def _pending_only_indices(
+        self,
+        campaign: Campaign,
+        miner_stats_list: List[Tuple[str, MinerWindowStats]],
+    ) -> Set[int]:
+        """
+        Get hotkey indices of a campaign's pending-only miners without scoring it.
+        
+        These are the miners compute_scores_for_campaign would give the pending
+        minimum score: pending miners in the metagraph that have no miner stats.
+        
+        Args:
+            campaign: Campaign object with scope and mech_id
+            miner_stats_list: Miner stats prefetched for this campaign
+        
+        Returns:
+            Set of hotkey indices
+        """
+        miners_with_stats = {miner_id for miner_id, _ in miner_stats_list}
+        pending_miners = self._get_pending_miners(campaign.scope) & self._hotkey_to_index.keys()
+        return {self._hotkey_to_index[hotkey] for hotkey in pending_miners - miners_with_stats}
+
+    @staticmethod
+    def _normalize_or_owner(miner_scores: np.ndarray, owner_index: Optional[int]) -> np.ndarray:
+        """
+        Normalize scores to sum to 1, or give all weight to the owner if they sum to 0.
+        
+        Args:
+            miner_scores: Scores aligned to the UID list
+            owner_index: Subnet owner's position in the UID list, if known
+        
+        Returns:
+            Weight vector aligned to the UID list (all zeros if scores are zero and
+            the owner is unknown)
+        """
+        total = miner_scores.sum()
+        if total > 0:
+            return miner_scores / total
+        campaign_weights_vec = np.zeros(len(miner_scores))
+        if owner_index is not None:
+            campaign_weights_vec[owner_index] = 1.0
+        return campaign_weights_vec
+
     def _process_weights(self):
         """Process weights for all active campaigns.
 
@@ -534,11 +987,37 @@ class Validator:
         3. Apply burn rules once via the score sink and submit a single
            ``set_weights`` extrinsic.
         """
+        # Drop per-cycle memos up front, so a cycle that raised part-way does not
+        # leave its window days or pending miners behind for the next one.
+        self.window_days_getter.clear_cache()
+        self._pending_miners_cache.clear()
+        # Collect the prefetch before any early return or raise below, so a stale
+        # future never blocks the next wait from starting a fresh prefetch.
+        prefetched_miner_stats = self._take_prefetched_miner_stats()
+
+        try:
+            self._aggregate_and_publish_weights(prefetched_miner_stats)
+        finally:
+            # Calls outside the weight cycle (set_weights_for_campaign, the burn data
+            # source's ratio getter) read the config source, not this cycle's map.
+            self._scope_configs = {}
+
+    def _aggregate_and_publish_weights(
+        self,
+        prefetched_miner_stats: Dict[Tuple[str, int], List[Tuple[str, MinerWindowStats]]],
+    ) -> None:
+        """
+        Score, aggregate and publish weights for the active campaigns; see _process_weights.
+        
+        Args:
+            prefetched_miner_stats: Miner stats prefetched for this update, keyed by
+                (campaign scope, window_days); missing windows are fetched here
+        """
         campaigns = self.get_campaigns()
-        logging.info(f"Processing {len(campaigns)} campaigns: {campaigns}")
+        if _info_enabled():
+            logging.info(f"Processing {len(campaigns)} campaigns: {campaigns}")
 
-        if getattr(self, "metric_active_campaigns", None) is not None:
-            self.metric_active_campaigns.set(len(campaigns))
+        self.metric_active_campaigns.set(len(campaigns))
 
         if not campaigns:
             logging.info("Zero active campaigns; setting weights to subnet owner (burn) then sleeping 60s.")
@@ -549,169 +1028,159 @@ class Validator:
                 logging.warning(f"Set weights to owner failed: {message}")
             return
 
-        # Prepare emission-based weights per campaign.
-        raw_splits = [
-            c.emission_split for c in campaigns if c.emission_split is not None and c.emission_split > 0
-        ]
-        if raw_splits:
-            total_split = sum(raw_splits)
-            campaign_weights: dict[str, float] = {}
-            for c in campaigns:
-                if c.emission_split is not None and c.emission_split > 0:
-                    campaign_weights[c.scope] = float(c.emission_split) / total_split
-            # Any campaign without explicit split gets zero weight.
+        # Resolve config for every mech_scope in one lookup; campaign workers and the
+        # burn resolver read from this map instead of fetching per campaign.
+        self._scope_configs = self.dynamic_config_source.get_configs(
+            {c.mech_scope for c in campaigns}
+        )
+
+        # Prepare emission-based weights per campaign. Any campaign without an
+        # explicit (positive) split gets zero weight.
+        # emission_weights[i] is the share of campaigns[i].
+        emission_weights = np.array(
+            [
+                float(c.emission_split) if c.emission_split is not None and c.emission_split > 0 else 0.0
+                for c in campaigns
+            ],
+            dtype=np.float64,
+        )
+        total_split = emission_weights.sum()
+        if total_split > 0:
+            emission_weights /= total_split
         else:
             # If no emission_split is provided, distribute weights uniformly.
-            uniform_weight = 1.0 / len(campaigns)
-            campaign_weights = {c.scope: uniform_weight for c in campaigns}
+            emission_weights = np.full(len(campaigns), 1.0 / len(campaigns))
 
         # Aggregated scores aligned to metagraph.uids.
-        aggregated_scores = [0.0] * len(self.metagraph.uids)
+        aggregated_scores = np.zeros(len(self._uids_list), dtype=np.float64)
         # Miners who received the pending minimum in at least one campaign; leave their final weight as-is (no re-normalization).
         pending_min_indices: set[int] = set()
 
         # Use the first campaign's mech_id/config as the mech_scope/burn scope.
         primary_campaign = campaigns[0]
-        primary_mech_scope = f"mech{primary_campaign.mech_id}"
+        primary_mech_scope = primary_campaign.mech_scope
 
-        for campaign in campaigns:
-            mech_scope = f"mech{campaign.mech_id}"
-            try:
-                logging.info(
-                    f"Computing scores for aggregation: campaign_scope={campaign.scope}, "
-                    f"mech_id={campaign.mech_id}, mech_scope={mech_scope}"
-                )
-
-                # Get scope-specific configuration using mech_scope.
-                scope_config = self.dynamic_config_source.get_config(mech_scope)
-                if scope_config is None:
-                    logging.warning(f"No configuration found for mech_scope {mech_scope}, using defaults")
-                    scope_config = get_default_config(mech_scope)
-                else:
-                    logging.info(
-                        f"Using config for mech_scope={mech_scope}: "
-                        f"use_soft_cap={scope_config.use_soft_cap}, "
-                        f"use_flooring={scope_config.use_flooring}, "
-                        f"w_sales={scope_config.w_sales}, w_rev={scope_config.w_rev}"
-                    )
-
-                # Create ScoreCalculator with scope-specific configuration.
-                score_calculator = ScoreCalculator(
-                    p95_provider=self.p95_provider,
-                    use_soft_cap=scope_config.use_soft_cap,
-                    use_flooring=scope_config.use_flooring,
-                    w_sales=scope_config.w_sales,
-                    w_rev=scope_config.w_rev,
-                    soft_cap_threshold=scope_config.soft_cap_threshold,
-                    soft_cap_factor=scope_config.soft_cap_factor,
-                )
+        # Resolve the subnet owner once per cycle, before any worker is started: burn
+        # resolution below also queries subtensor, and its websocket connection must
+        # not be shared by concurrent calls.
+        owner_index = self.score_sink._get_owner_index()
 
-                # Compute scores for this campaign.
-                score_results = self.compute_scores_for_campaign(campaign, score_calculator)
+        # Each campaign's weight vector (scoring, burn application, normalization) is
+        # independent, so it is built on the I/O pool. Burn percentages are resolved
+        # meanwhile on the single-thread burn pool (their subtensor queries stay
+        # sequential). Only the emission-weighted aggregation stays on this thread,
+        # consuming vectors in campaign order so the float sums are deterministic.
 
-                # Track miners that got the pending minimum so we leave their final weight as-is.
-                pending_miners_this = self.pending_miners_source.get_pending_miners(campaign.scope)
-                for r in score_results:
-                    if (
-                        r.score == PENDING_MINER_MIN_SCORE
-                        and r.miner_id in pending_miners_this
-                        and r.miner_id in self.metagraph.hotkeys
-                    ):
-                        pending_min_indices.add(self.metagraph.hotkeys.index(r.miner_id))
-
-                # Build UID->score map (miner_id is hotkey).
-                uids = list(self.metagraph.uids)
-                scores_by_uid: dict[int, float] = {}
-                for result in score_results:
-                    if result.miner_id not in self.metagraph.hotkeys:
-                        continue
-                    hotkey_index = self.metagraph.hotkeys.index(result.miner_id)
-                    if hotkey_index < len(self.metagraph.uids):
-                        uid = self.metagraph.uids[hotkey_index]
-                        scores_by_uid[uid] = result.score
-                miner_scores = [scores_by_uid.get(uid, 0.0) for uid in uids]
-
-                # Apply this campaign's burn_percentage (per mechanism/company config).
-                burn_percentage = None
-                if self.burn_percentage_resolver is not None:
-                    burn_percentage = self.burn_percentage_resolver(
-                        mech_scope, miner_stats_scope=campaign.scope
+        # Fetch every campaign's miner stats in one batch up front; the same lists
+        # feed scoring and the burn data source's total-sales lookup.
+        # Windows prefetched while waiting for this update are used as-is.
+        scope_windows = [(c.scope, self.window_days_getter(c.mech_scope)) for c in campaigns]
+        miner_stats_by_window = prefetched_miner_stats
+        missing_windows = [sw for sw in scope_windows if sw not in miner_stats_by_window]
+        if missing_windows:
+            fetched = self.miner_stats_source.fetch_window_many(missing_windows, executor=self._io_pool)
+            for scope_window in missing_windows:
+                miner_stats_by_window[scope_window] = fetched[scope_window]
+        miner_stats_by_campaign = [miner_stats_by_window[sw] for sw in scope_windows]
+        # Pending-only miners are likewise fetched for all campaigns at once and
+        # served to the campaign workers from the per-cycle cache.
+        pending_by_scope = self.pending_miners_source.get_pending_miners_many(
+            [c.scope for c in campaigns if c.scope not in self._pending_miners_cache],
+            executor=self._io_pool,
+        )
+        for scope, pending_miners in pending_by_scope.items():
+            self._pending_miners_cache[scope] = frozenset(pending_miners)
+        self.burn_data_source.clear_cycle_cache()
+        # Seed the P95 provider with every campaign's window, scored or not: AUTO-mode
+        # P95 for a mech_scope reads its primary campaign's stats, which may belong
+        # to a campaign skipped below for having no emission share.
+        for campaign, miner_stats_list in zip(campaigns, miner_stats_by_campaign):
+            self.burn_data_source.set_miner_stats_cache(campaign.scope, miner_stats_list)
+            self.p95_provider.set_miner_stats_cache(campaign.scope, miner_stats_list)
+        # Campaigns without emission share contribute nothing to the aggregate, so
+        # they are neither scored nor burned; only their pending miners are kept.
+        active = (emission_weights > 0.0).tolist()
+        # One burn lookup per distinct (mech_scope, campaign scope) pair this cycle.
+        burn_futures_by_key: Dict[Tuple[str, str], Future] = {}
+        if self.burn_percentage_resolver is not None:
+            for campaign, is_active in zip(campaigns, active):
+                if not is_active:
+                    continue
+                key = (campaign.mech_scope, campaign.scope)
+                if key not in burn_futures_by_key:
+                    burn_futures_by_key[key] = self._burn_pool.submit(
+                        self.burn_percentage_resolver, campaign.mech_scope, miner_stats_scope=campaign.scope
                     )
-                creator_uid = self.score_sink._get_owner_uid()
-
-                if burn_percentage is not None and burn_percentage > 0.0:
-                    try:
-                        final_uids, final_weights = apply_creator_burn(
-                            uids=uids,
-                            miner_scores=miner_scores,
-                            creator_uid=creator_uid,
-                            burn_percentage=burn_percentage,
-                        )
-                        weights_dict = dict(zip(final_uids, final_weights))
-                        campaign_weights_vec = [
-                            weights_dict.get(uid, 0.0) for uid in self.metagraph.uids
-                        ]
-                        if sum(campaign_weights_vec) == 0.0:
-                            owner_index = self.score_sink._get_owner_index()
-                            if owner_index is not None:
-                                campaign_weights_vec = [0.0] * len(uids)
-                                campaign_weights_vec[owner_index] = 1.0
-                        logging.info(
-                            f"Applied burn {burn_percentage}% for campaign {campaign.scope} (mech_scope={mech_scope})"
-                        )
-                    except Exception as e:
-                        logging.warning(
-                            f"Failed to apply creator burn for campaign {campaign.scope}: {e}, using normalized scores"
-                        )
-                        total = sum(miner_scores)
-                        campaign_weights_vec = (
-                            [s / total for s in miner_scores]
-                            if total > 0
-                            else [0.0] * len(uids)
-                        )
-                        if total <= 0:
-                            owner_index = self.score_sink._get_owner_index()
-                            if owner_index is not None:
-                                campaign_weights_vec[owner_index] = 1.0
-                else:
-                    total = sum(miner_scores)
-                    if total > 0:
-                        campaign_weights_vec = [s / total for s in miner_scores]
-                    else:
-                        campaign_weights_vec = [0.0] * len(uids)
-                        owner_index = self.score_sink._get_owner_index()
-                        if owner_index is not None:
-                            campaign_weights_vec[owner_index] = 1.0
-
-                emission_weight = campaign_weights.get(campaign.scope, 0.0)
-                if emission_weight <= 0.0:
+        burn_futures = [burn_futures_by_key.get((c.mech_scope, c.scope)) for c in campaigns]
+        weights_futures = [
+            self._io_pool.submit(
+                self._compute_campaign_weights,
+                campaign,
+                miner_stats_list,
+                burn_future,
+                owner_index,
+            )
+            if is_active
+            else None
+            for campaign, miner_stats_list, burn_future, is_active in zip(
+                campaigns, miner_stats_by_campaign, burn_futures, active
+            )
+        ]
+        # Per-scope metric increments, flushed once after the loop.
+        sets_by_scope: collections.Counter = collections.Counter()
+        errors_by_scope: collections.Counter = collections.Counter()
+        for campaign, miner_stats_list, weights_future, emission_weight in zip(
+            campaigns, miner_stats_by_campaign, weights_futures, emission_weights.tolist()
+        ):
+            mech_scope = campaign.mech_scope
+            try:
+                if weights_future is None:
+                    pending_min_indices.update(self._pending_only_indices(campaign, miner_stats_list))
                     continue
 
-                # Aggregate into global scores using emission-based weight.
-                for idx, w in enumerate(campaign_weights_vec):
-                    aggregated_scores[idx] += emission_weight * w
+                campaign_weights_vec, pending_indices = weights_future.result()
+                # Track miners that got the pending minimum so we leave their final weight as-is.
+                pending_min_indices.update(pending_indices)
 
-                if getattr(self, "metric_weights_sets_total", None) is not None:
-                    self.metric_weights_sets_total.labels(
-                        hotkey=self.hotkey_address,
-                        scope=mech_scope,
-                    ).inc()
+                # Aggregate into global scores using emission-based weight. Each worker
+                # returns a fresh vector, so it is scaled in place and added into the
+                # accumulator without allocating a temporary.
+                campaign_weights_vec *= emission_weight
+                np.add(aggregated_scores, campaign_weights_vec, out=aggregated_scores)
+
+                sets_by_scope[mech_scope] += 1
             except Exception as e:
-                logging.error(f"Error computing aggregated scores for campaign {campaign.scope}: {e}")
-                traceback.print_exc()
-                if getattr(self, "metric_weights_errors_total", None) is not None:
-                    self.metric_weights_errors_total.labels(
-                        hotkey=self.hotkey_address,
-                        scope=mech_scope,
-                    ).inc()
+                self._log_error(
+                    campaign.scope,
+                    f"Error computing aggregated scores for campaign {campaign.scope}: {e}",
+                    e,
+                )
+                errors_by_scope[mech_scope] += 1
+        for mech_scope, count in sets_by_scope.items():
+            self._scoped_metric(
+                self.metric_weights_sets_total,
+                self._metric_weights_sets_by_scope,
+                mech_scope,
+            ).inc(count)
+        for mech_scope, count in errors_by_scope.items():
+            self._scoped_metric(
+                self.metric_weights_errors_total,
+                self._metric_weights_errors_by_scope,
+                mech_scope,
+            ).inc(count)
+        # Let any burn lookups skipped by a failed campaign finish before dropping
+        # the miner stats they read.
+        wait(burn_futures_by_key.values())
+        self.burn_data_source.clear_cycle_cache()
+        self.p95_provider.clear_miner_stats_cache()
 
         # If all aggregated scores are zero, fallback to owner-only burn behaviour.
-        if sum(aggregated_scores) == 0.0:
+        if not aggregated_scores.any():
             logging.info(
                 "Aggregated scores are all zero; setting weights to subnet owner (burn) "
                 "and skipping on-chain aggregation publish."
             )
-            success, message = self.score_sink.set_weights_to_owner_only()
+            success, message = self.score_sink.set_weights_to_owner_only(owner_index)
             if success:
                 logging.info(f"Set weights to owner (burn): {message}")
             else:
@@ -720,65 +1189,111 @@ class Validator:
 
         # Final normalisation of aggregated scores into [0,1] with sum 1.
         # Leave pending-minimum rating as-is for miners that received it; do not re-calculate / dilute it.
-        total_agg = sum(aggregated_scores)
+        total_agg = float(aggregated_scores.sum())
         if total_agg <= 0:
-            final_scores = [0.0] * len(aggregated_scores)
+            final_scores = np.zeros_like(aggregated_scores)
         else:
-            final_scores = [s / total_agg for s in aggregated_scores]
+            # Normalize in place; the result stays a float64 array all the way to
+            # publish_weights, which converts it to a list once for the extrinsic.
+            aggregated_scores /= total_agg
+            final_scores = aggregated_scores
             if pending_min_indices:
                 # Give pending-min miners exactly PENDING_MINER_MIN_SCORE; distribute the rest to others.
                 n_pending = len(pending_min_indices)
                 remaining = 1.0 - n_pending * PENDING_MINER_MIN_SCORE
                 if remaining < 0.0:
                     remaining = 0.0
-                other_indices = [i for i in range(len(aggregated_scores)) if i not in pending_min_indices]
-                sum_other = sum(aggregated_scores[i] for i in other_indices)
-                for i in pending_min_indices:
-                    final_scores[i] = PENDING_MINER_MIN_SCORE
+                other_mask = np.ones(len(final_scores), dtype=bool)
+                other_mask[list(pending_min_indices)] = False
+                n_other = int(other_mask.sum())
+                sum_other = float(final_scores[other_mask].sum())
                 if sum_other > 0 and remaining > 0:
-                    for i in other_indices:
-                        final_scores[i] = remaining * (aggregated_scores[i] / sum_other)
-                elif sum_other <= 0 and other_indices:
-                    for i in other_indices:
-                        final_scores[i] = remaining / len(other_indices)
+                    final_scores[other_mask] *= remaining / sum_other
+                elif sum_other <= 0 and n_other:
+                    final_scores[other_mask] = remaining / n_other
+                final_scores[~other_mask] = PENDING_MINER_MIN_SCORE
                 logging.info(
                     f"Left minimum rating as-is ({PENDING_MINER_MIN_SCORE}) for {n_pending} pending-only miner(s)"
                 )
 
-        # Build a single ScoreResult list for all miners using aggregated scores.
-        aggregated_results: list[ScoreResult] = []
-        for hotkey, score in zip(self.metagraph.hotkeys, final_scores):
-            aggregated_results.append(
-                ScoreResult(
-                    miner_id=hotkey,
-                    base=score,
-                    refund_multiplier=1.0,
-                    score=score,
-                )
-            )
-
-        # Publish once via score sink. We use the primary mech_scope for configuration
-        # and burn calculation, and the primary campaign as miner_stats_scope input
-        # for burn percentage resolver.
+        # Publish once via score sink. Burn was already applied per campaign and the
+        # scores are aligned to metagraph.uids, so they go out as final weights.
         logging.info(
-            f"Publishing aggregated scores for {len(self.metagraph.hotkeys)} miners "
+            f"Publishing aggregated scores for {len(self._hotkeys_snapshot)} miners "
             f"using primary_mech_scope={primary_mech_scope}, "
             f"primary_campaign_scope={primary_campaign.scope}"
         )
-        success, message = self.score_sink.publish(
-            aggregated_results,
-            primary_mech_scope,
-            miner_stats_scope=primary_campaign.scope,
-            apply_burn=False,
-        )
-        if not success:
+        success, message = self.score_sink.publish_weights(final_scores, primary_mech_scope)
+        if success:
+            # Weights for this campaign set are on chain; pick up campaign and
+            # config changes next cycle.
+            self.campaign_source.invalidate()
+            self.dynamic_config_source.invalidate()
+        else:
             logging.warning(
                 f"Set weights failed for aggregated campaigns; leaving weights as is: {message}"
             )
     
+    def _prefetch_miner_stats(
+        self, scope_windows: List[Tuple[str, int]]
+    ) -> Dict[Tuple[str, int], List[Tuple[str, MinerWindowStats]]]:
+        """
+        Fetch the miner stats windows the next weight update will need.
+        
+        Runs as a single task on the I/O pool while the main thread waits for the
+        final blocks before the update. The windows are fetched one after another
+        on that task: submitting them to the same pool and blocking on the results
+        could deadlock once the pool is saturated.
+        
+        Args:
+            scope_windows: (campaign scope, window_days) pairs, resolved on the main thread
+        
+        Returns:
+            Dictionary mapping (campaign scope, window_days) -> miner stats
+        """
+        return self.miner_stats_source.fetch_window_many(scope_windows)
+
+    def _take_prefetched_miner_stats(self) -> Dict[Tuple[str, int], List[Tuple[str, MinerWindowStats]]]:
+        """
+        Collect miner stats prefetched during the wait, if any.
+        
+        Returns:
+            Dictionary mapping (campaign scope, window_days) -> miner stats; empty
+            if nothing was prefetched or the prefetch failed
+        """
+        prefetch_future, self._prefetch_future = self._prefetch_future, None
+        if prefetch_future is None:
+            return {}
+        try:
+            return prefetch_future.result()
+        except Exception as e:
+            logging.warning(f"Miner stats prefetch failed, fetching now: {e}")
+            return {}
+
     def _sleep_until_next_update(self):
-        """Sleep until next weight update is due."""
-        sleep_seconds = max(1, (self.tempo - self.last_update) * BLOCKTIME)
+        """
+        Sleep part of the way towards the next weight update, then re-check the chain.
+        
+        Far from tempo the validator sleeps for poll_multiplier of the remaining
+        time; within POLL_MIN_BLOCKS_REMAINING blocks it polls once per block so
+        weights go out shortly after they become due.
+        """
+        blocks_remaining = self.tempo - self.last_update
+        if blocks_remaining > POLL_MIN_BLOCKS_REMAINING:
+            sleep_seconds = blocks_remaining * BLOCKTIME * self.config.poll_multiplier
+        else:
+            sleep_seconds = BLOCKTIME
+            # Overlap the final blocks of the wait with fetching the next update's inputs.
+            # Campaigns and window days are resolved here, on the main thread, since a
+            # campaign refresh updates the P95 provider's scope mapping.
+            if self._prefetch_future is None:
+                try:
+                    scope_windows = [
+                        (c.scope, self.window_days_getter(c.mech_scope)) for c in self.get_campaigns()
+                    ]
+                    self._prefetch_future = self._io_pool.submit(self._prefetch_miner_stats, scope_windows)
+                except Exception as e:
+                    logging.warning(f"Failed to start miner stats prefetch: {e}")
         logging.info(f"Not time to set weights yet. Sleeping for {sleep_seconds} seconds.")
         time.sleep(sleep_seconds)
         self.last_update = self.subtensor.blocks_since_last_update(
@@ -13,7 +13,10 @@ def main():
     # We don't want to start the metrics HTTP server (port 9100) when
     # running set_weights.py locally.
     validator = Validator(enable_metrics=False)
-    validator._process_weights()
+    try:
+        validator._process_weights()
+    finally:
+        validator._shutdown_pools()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,76 @@
+"""
+Test cases for the array burn kernel against bitads_v3_core's apply_creator_burn.
+"""
+import math
+import random
+import unittest
+
+import numpy as np
+from bitads_v3_core.domain.creator_burn import apply_creator_burn
+
+from core.burn_calculator import apply_creator_burn_np
+
+
+TOLERANCE = 1e-9
+
+
+class TestApplyCreatorBurnNp(unittest.TestCase):
+    """apply_creator_burn_np must match apply_creator_burn when the creator is a scored UID."""
+
+    def setUp(self):
+        self.rng = random.Random(1234)
+
+    def _random_scores(self, n: int) -> list:
+        """Scores with zeros, negatives and non-finite values mixed in."""
+        choices = [0.0, -1.0, math.nan, math.inf]
+        return [
+            self.rng.choice(choices) if self.rng.random() < 0.2 else self.rng.uniform(0.0, 10.0)
+            for _ in range(n)
+        ]
+
+    def _assert_matches(self, scores: list, creator_index, burn_percentage: float):
+        uids = list(range(100, 100 + len(scores)))
+        creator_uid = uids[creator_index] if creator_index is not None else None
+        expected_uids, expected = apply_creator_burn(uids, scores, creator_uid, burn_percentage)
+        result = apply_creator_burn_np(np.array(scores), creator_index, burn_percentage)
+
+        self.assertEqual(expected_uids, uids)
+        self.assertEqual(len(result), len(expected))
+        for got, want in zip(result.tolist(), expected):
+            self.assertAlmostEqual(got, want, delta=TOLERANCE)
+
+    def test_matches_reference_random(self):
+        """Random score vectors, creators and burn percentages."""
+        for _ in range(500):
+            n = self.rng.randint(1, 64)
+            scores = self._random_scores(n)
+            creator_index = self.rng.randrange(n)
+            burn_percentage = self.rng.choice([0.0, 100.0, self.rng.uniform(0.0, 100.0)])
+            self._assert_matches(scores, creator_index, burn_percentage)
+
+    def test_matches_reference_without_creator(self):
+        """With no creator the burn is skipped and scores are only normalized."""
+        for _ in range(100):
+            scores = self._random_scores(self.rng.randint(1, 32))
+            self._assert_matches(scores, None, 50.0)
+
+    def test_matches_reference_out_of_range_burn(self):
+        """Burn percentages outside [0, 100] are clamped."""
+        scores = [1.0, 2.0, 3.0, 4.0]
+        self._assert_matches(scores, 0, -10.0)
+        self._assert_matches(scores, 0, 150.0)
+
+    def test_all_invalid_scores_return_zeros(self):
+        """No valid miner signal gives an all-zero vector."""
+        result = apply_creator_burn_np(np.array([math.nan, -1.0, 0.0, 5.0]), 3, 50.0)
+        self.assertEqual(result.tolist(), [0.0, 0.0, 0.0, 0.0])
+
+    def test_input_not_modified(self):
+        """The score vector passed in is left untouched."""
+        scores = np.array([1.0, 2.0, 3.0])
+        apply_creator_burn_np(scores, 0, 50.0)
+        self.assertEqual(scores.tolist(), [1.0, 2.0, 3.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,6 +5,7 @@ import unittest
 from unittest.mock import Mock, MagicMock, patch
 from typing import List, Optional
 
+import numpy as np
 from bitads_v3_core.domain.models import ScoreResult
 from core.adapters.score_sink import ValidatorScoreSink
 
@@ -42,12 +43,6 @@ class TestValidatorScoreSink(unittest.TestCase):
         self.creator_uid = 99
         self.creator_index = 4
         
-        # Mock mechid resolver
-        def mechid_resolver(scope: str) -> int:
-            return 0 if scope == "network" else 1
-        
-        self.mechid_resolver = mechid_resolver
-        
         # Create score sink instance
         self.score_sink = ValidatorScoreSink(
             subtensor=self.mock_subtensor,
@@ -55,7 +50,6 @@ class TestValidatorScoreSink(unittest.TestCase):
             metagraph=self.mock_metagraph,
             netuid=1,
             tempo=100,
-            mechid_resolver=self.mechid_resolver,
             burn_percentage_resolver=None,  # No burn by default
         )
     
@@ -417,6 +411,90 @@ class TestValidatorScoreSink(unittest.TestCase):
         self.assertAlmostEqual(weights[1], 0.5 / total_score, delta=TOLERANCE)
         self.assertAlmostEqual(weights[self.creator_index], 0.0, delta=TOLERANCE)
 
+    def test_publish_weights_normalizes_without_burn(self):
+        """Test that publish_weights normalizes pre-burned weights and applies no burn."""
+        def burn_resolver(scope: str) -> Optional[float]:
+            return 50.0
+        
+        # Weights passed to publish_weights are already burned; the resolver must be ignored
+        self.score_sink.burn_percentage_resolver = burn_resolver
+        
+        captured_weights = []
+        def mock_set_weights(**kwargs):
+            captured_weights.append(kwargs['weights'])
+            return (True, "Success")
+        
+        self.score_sink._set_weights = mock_set_weights
+        
+        success, _ = self.score_sink.publish_weights(np.array([0.0, 2.0, 1.0, 1.0, 4.0]), "network")
+        
+        self.assertTrue(success)
+        self.assertEqual(len(captured_weights), 1)
+        weights = captured_weights[0]
+        self.assertAlmostEqual(sum(weights), 1.0, delta=TOLERANCE)
+        self.assertAlmostEqual(weights[0], 0.0, delta=TOLERANCE)
+        self.assertAlmostEqual(weights[1], 0.25, delta=TOLERANCE)
+        self.assertAlmostEqual(weights[2], 0.125, delta=TOLERANCE)
+        self.assertAlmostEqual(weights[3], 0.125, delta=TOLERANCE)
+        self.assertAlmostEqual(weights[self.creator_index], 0.5, delta=TOLERANCE)
+    
+    def test_publish_weights_zero_falls_back_to_owner(self):
+        """Test that all-zero weights passed to publish_weights go to the owner."""
+        captured_weights = []
+        def mock_set_weights(**kwargs):
+            captured_weights.append(kwargs['weights'])
+            return (True, "Success")
+        
+        self.score_sink._set_weights = mock_set_weights
+        
+        self.score_sink.publish_weights([0.0] * 5, "network")
+        
+        weights = captured_weights[0]
+        for i in range(len(weights)):
+            expected = 1.0 if i == self.creator_index else 0.0
+            self.assertAlmostEqual(weights[i], expected, delta=TOLERANCE)
+    
+    def test_owner_only_weights_cached_and_read_only(self):
+        """Test that the owner-only vector is reused, read-only and rebuilt on resize."""
+        captured_weights = []
+        def mock_set_weights(**kwargs):
+            captured_weights.append(kwargs['weights'])
+            return (True, "Success")
+        
+        self.score_sink._set_weights = mock_set_weights
+        
+        self.score_sink.set_weights_to_owner_only()
+        self.score_sink.set_weights_to_owner_only()
+        
+        self.assertEqual(len(captured_weights), 2)
+        self.assertIs(captured_weights[0], captured_weights[1])
+        weights = captured_weights[0]
+        self.assertEqual(weights.tolist(), [0.0, 0.0, 0.0, 0.0, 1.0])
+        with self.assertRaises(ValueError):
+            weights[0] = 1.0
+        # Owner hotkey is queried once and then served from cache
+        self.assertEqual(self.mock_subtensor.get_subnet_owner_hotkey.call_count, 1)
+        
+        # A metagraph resync that grows the UID list rebuilds the vector
+        self.mock_metagraph.uids = [0, 1, 2, 3, 99, 100]
+        self.mock_metagraph.hotkeys = self.mock_metagraph.hotkeys + ["5Miner4Hotkey123456789012345678901234567890123"]
+        self.score_sink.set_weights_to_owner_only()
+        
+        resized = captured_weights[2]
+        self.assertIsNot(resized, weights)
+        self.assertEqual(resized.tolist(), [0.0, 0.0, 0.0, 0.0, 1.0, 0.0])
+    
+    def test_owner_only_weights_owner_not_found(self):
+        """Test that no weights are set when the owner is not in the metagraph."""
+        self.mock_subtensor.get_subnet_owner_hotkey.return_value = "5UnknownHotkey123456789012345678901234567890123"
+        self.score_sink._set_weights = Mock()
+        
+        success, message = self.score_sink.set_weights_to_owner_only()
+        
+        self.assertFalse(success)
+        self.assertEqual(message, "Owner UID not found")
+        self.score_sink._set_weights.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,145 @@
+"""
+Test cases for VectorizedScoreCalculator against bitads_v3_core's ScoreCalculator.
+"""
+import random
+import unittest
+
+from bitads_v3_core.app.ports import IP95Provider
+from bitads_v3_core.app.scoring import ScoreCalculator
+from bitads_v3_core.domain.models import MinerWindowStats, Percentiles
+
+from core.scoring import VectorizedScoreCalculator
+
+
+TOLERANCE = 1e-9
+
+
+class FixedP95Provider(IP95Provider):
+    """P95 provider returning fixed percentiles and counting lookups."""
+
+    def __init__(self, percentiles: Percentiles):
+        self.percentiles = percentiles
+        self.calls = 0
+
+    def get_effective_p95(self, scope: str) -> Percentiles:
+        self.calls += 1
+        return self.percentiles
+
+
+class TestVectorizedScoreCalculator(unittest.TestCase):
+    """VectorizedScoreCalculator.score_many must match the per-miner implementation."""
+
+    def setUp(self):
+        self.rng = random.Random(4321)
+
+    def _random_entries(self, n: int) -> list:
+        entries = []
+        for i in range(n):
+            sales = self.rng.choice([0, 1, 2, self.rng.randint(0, 500)])
+            entries.append((
+                f"hotkey{i}",
+                MinerWindowStats(
+                    sales=sales,
+                    revenue_usd=self.rng.choice([0.0, self.rng.uniform(0.0, 50000.0)]),
+                    refund_orders=self.rng.randint(0, sales + 2),
+                ),
+            ))
+        return entries
+
+    def _random_calculator_kwargs(self) -> dict:
+        w_sales = self.rng.uniform(0.0, 1.0)
+        return {
+            "use_soft_cap": self.rng.random() < 0.5,
+            "w_sales": w_sales,
+            "w_rev": 1.0 - w_sales,
+            "soft_cap_threshold": self.rng.randint(1, 10),
+            "soft_cap_factor": self.rng.uniform(0.0, 1.0),
+        }
+
+    def test_matches_reference_random(self):
+        """Random miner windows, percentiles and scoring parameters."""
+        for _ in range(200):
+            entries = self._random_entries(self.rng.randint(1, 64))
+            percentiles = Percentiles(
+                p95_sales=self.rng.choice([0.0, self.rng.uniform(1.0, 500.0)]),
+                p95_revenue_usd=self.rng.choice([0.0, self.rng.uniform(1.0, 50000.0)]),
+            )
+            kwargs = self._random_calculator_kwargs()
+            expected = ScoreCalculator(p95_provider=FixedP95Provider(percentiles), **kwargs).score_many(entries, "mech0")
+            result = VectorizedScoreCalculator(p95_provider=FixedP95Provider(percentiles), **kwargs).score_many(entries, "mech0")
+
+            self.assertEqual(len(result), len(expected))
+            for got, want in zip(result, expected):
+                self.assertEqual(got.miner_id, want.miner_id)
+                self.assertAlmostEqual(got.base, want.base, delta=TOLERANCE)
+                self.assertAlmostEqual(got.refund_multiplier, want.refund_multiplier, delta=TOLERANCE)
+                self.assertAlmostEqual(got.score, want.score, delta=TOLERANCE)
+
+    def test_columns_follow_entry_order(self):
+        """Each result uses its own miner's sales, revenue and refunds, in entry order."""
+        provider = FixedP95Provider(Percentiles(p95_sales=100.0, p95_revenue_usd=10000.0))
+        entries = [
+            ("hotkey0", MinerWindowStats(sales=10, revenue_usd=0.0, refund_orders=5)),
+            ("hotkey1", MinerWindowStats(sales=4, revenue_usd=900.0, refund_orders=1)),
+            ("hotkey2", MinerWindowStats(sales=100, revenue_usd=10000.0, refund_orders=0)),
+        ]
+        results = VectorizedScoreCalculator(
+            p95_provider=provider, use_soft_cap=False, w_sales=0.5, w_rev=0.5
+        ).score_many(entries, "mech0")
+
+        self.assertEqual([r.miner_id for r in results], ["hotkey0", "hotkey1", "hotkey2"])
+        self.assertEqual([r.refund_multiplier for r in results], [0.5, 0.75, 1.0])
+        # hotkey0 has no revenue, so only its sales term contributes
+        self.assertAlmostEqual(results[0].base, 0.5 * (10 ** 0.5 / 10.0), delta=TOLERANCE)
+        self.assertAlmostEqual(results[2].base, 1.0, delta=TOLERANCE)
+
+    def test_negative_inputs_raise_like_reference(self):
+        """Negative sales or revenue raise ValueError instead of scoring 0 or NaN."""
+        percentiles = Percentiles(p95_sales=10.0, p95_revenue_usd=100.0)
+        negative_sales = MinerWindowStats(sales=1, revenue_usd=10.0, refund_orders=0)
+        object.__setattr__(negative_sales, "sales", -3)
+        negative_revenue = MinerWindowStats(sales=2, revenue_usd=0.0, refund_orders=0)
+        object.__setattr__(negative_revenue, "revenue_usd", -5.0)
+
+        for stats in (negative_sales, negative_revenue):
+            entries = [("hotkey0", MinerWindowStats(sales=1, revenue_usd=1.0, refund_orders=0)), ("hotkey1", stats)]
+            with self.assertRaises(ValueError):
+                ScoreCalculator(p95_provider=FixedP95Provider(percentiles)).score_many(entries, "mech0")
+            with self.assertRaises(ValueError):
+                VectorizedScoreCalculator(p95_provider=FixedP95Provider(percentiles)).score_many(entries, "mech0")
+
+    def test_negative_p95_raises_like_reference(self):
+        """Negative P95 percentiles raise ValueError."""
+        entries = [("hotkey0", MinerWindowStats(sales=1, revenue_usd=1.0, refund_orders=0))]
+        for field in ("p95_sales", "p95_revenue_usd"):
+            percentiles = Percentiles(p95_sales=10.0, p95_revenue_usd=100.0)
+            object.__setattr__(percentiles, field, -1.0)
+            with self.assertRaises(ValueError):
+                ScoreCalculator(p95_provider=FixedP95Provider(percentiles)).score_many(entries, "mech0")
+            with self.assertRaises(ValueError):
+                VectorizedScoreCalculator(p95_provider=FixedP95Provider(percentiles)).score_many(entries, "mech0")
+
+    def test_empty_entries(self):
+        """No entries gives no results and no P95 lookup."""
+        provider = FixedP95Provider(Percentiles(p95_sales=10.0, p95_revenue_usd=100.0))
+        self.assertEqual(VectorizedScoreCalculator(p95_provider=provider).score_many([], "mech0"), [])
+        self.assertEqual(provider.calls, 0)
+
+    def test_p95_resolved_once(self):
+        """P95 is looked up once per call, not once per miner."""
+        provider = FixedP95Provider(Percentiles(p95_sales=10.0, p95_revenue_usd=100.0))
+        entries = [(f"hotkey{i}", MinerWindowStats(sales=i + 1, revenue_usd=10.0, refund_orders=0)) for i in range(10)]
+        VectorizedScoreCalculator(p95_provider=provider).score_many(entries, "mech0")
+        self.assertEqual(provider.calls, 1)
+
+    def test_zero_sales_skip_p95(self):
+        """When no miner has sales, all scores are 0.0 and P95 is not requested."""
+        provider = FixedP95Provider(Percentiles(p95_sales=10.0, p95_revenue_usd=100.0))
+        entries = [("hotkey0", MinerWindowStats(sales=0, revenue_usd=5.0, refund_orders=0))]
+        results = VectorizedScoreCalculator(p95_provider=provider).score_many(entries, "mech0")
+        self.assertEqual([r.score for r in results], [0.0])
+        self.assertEqual(provider.calls, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
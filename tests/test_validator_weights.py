@@ -0,0 +1,238 @@
+"""
+Test cases for Validator._process_weights campaign aggregation.
+"""
+import dataclasses
+import unittest
+from concurrent.futures import Future, ThreadPoolExecutor
+from unittest.mock import Mock
+
+from bitads_v3_core.app.ports import IP95Provider
+from bitads_v3_core.app.scoring import ScoreCalculator
+from bitads_v3_core.domain.models import MinerWindowStats, P95Config, P95Mode
+from bitads_v3_core.domain.percentiles import compute_auto_p95
+
+from core.adapters.dynamic_config_source import get_default_config
+from core.adapters.p95_provider import ValidatorP95Provider
+from core.constants import PENDING_MINER_MIN_SCORE
+from core.domain.campaign import Campaign
+from core.resolvers import WindowDaysGetter
+from neurons.validator import Validator
+
+
+TOLERANCE = 1e-9
+WINDOW_DAYS = 7
+
+OWNER = "5OwnerHotkey"
+MINER_A = "5MinerAHotkey"
+MINER_B = "5MinerBHotkey"
+MINER_C = "5MinerCHotkey"
+PENDING = "5PendingHotkey"
+HOTKEYS = [OWNER, MINER_A, MINER_B, MINER_C, PENDING]
+
+# Campaign "A" is the primary campaign of mech0 (its window drives AUTO P95) but has
+# no emission share; campaign "B" receives all of it.
+MINER_STATS = {
+    "A": [
+        (MINER_A, MinerWindowStats(sales=50, revenue_usd=1000.0, refund_orders=0)),
+        (MINER_B, MinerWindowStats(sales=40, revenue_usd=800.0, refund_orders=1)),
+    ],
+    "B": [
+        (MINER_B, MinerWindowStats(sales=5, revenue_usd=100.0, refund_orders=0)),
+        (MINER_C, MinerWindowStats(sales=3, revenue_usd=40.0, refund_orders=1)),
+    ],
+}
+
+
+class _FixedP95Provider(IP95Provider):
+    """P95 provider returning fixed percentiles."""
+
+    def __init__(self, percentiles):
+        self.percentiles = percentiles
+
+    def get_effective_p95(self, scope):
+        return self.percentiles
+
+
+class TestProcessWeightsAggregation(unittest.TestCase):
+    """Aggregation of per-campaign weights into the published weight vector."""
+
+    def setUp(self):
+        """Build a Validator around mocked sources, skipping the chain bootstrap in __init__."""
+        validator = Validator.__new__(Validator)
+        validator.hotkey_address = "5ValidatorHotkey"
+        validator._init_noop_metrics()
+        validator.metagraph = Mock()
+        validator.metagraph.uids = list(range(len(HOTKEYS)))
+        validator.metagraph.hotkeys = list(HOTKEYS)
+        validator._refresh_hotkeys_snapshot()
+
+        validator._scope_configs = {}
+        validator._score_calculators = {}
+        validator._error_log_times = {}
+        validator._pending_miners_cache = {}
+        validator._prefetch_future = None
+        validator._io_pool = ThreadPoolExecutor(max_workers=4)
+        validator._burn_pool = ThreadPoolExecutor(max_workers=1)
+
+        self.scope_config = dataclasses.replace(get_default_config("mech0"), window_days=WINDOW_DAYS)
+        validator.dynamic_config_source = Mock()
+        validator.dynamic_config_source.get_configs.return_value = {"mech0": self.scope_config}
+        validator.dynamic_config_source.get_config.return_value = self.scope_config
+        validator.window_days_getter = WindowDaysGetter(validator.dynamic_config_source)
+
+        validator.miner_stats_source = Mock()
+        validator.miner_stats_source.fetch_window_many.side_effect = (
+            lambda scope_windows, executor=None: {sw: MINER_STATS[sw[0]] for sw in scope_windows}
+        )
+        validator.pending_miners_source = Mock()
+        validator.pending_miners_source.get_pending_miners_many.side_effect = (
+            lambda scopes, executor=None: {scope: ({PENDING} if scope == "A" else set()) for scope in scopes}
+        )
+
+        config_source = Mock()
+        config_source.get_p95_config.return_value = P95Config(mode=P95Mode.AUTO, scope="mech0")
+        validator.p95_provider = ValidatorP95Provider(
+            config_source=config_source,
+            miner_stats_source=validator.miner_stats_source,
+            mech_scope_to_campaign_scope={"mech0": "A"},
+        )
+
+        validator.burn_data_source = Mock()
+        validator.burn_percentage_resolver = Mock(return_value=None)
+        validator.campaign_source = Mock()
+        validator.score_sink = Mock()
+        validator.score_sink._get_owner_index.return_value = 0
+        validator.score_sink.publish_weights.return_value = (True, "Success")
+        validator.score_sink.set_weights_to_owner_only.return_value = (True, "Success")
+        self.validator = validator
+
+    def tearDown(self):
+        self.validator._io_pool.shutdown(wait=True)
+        self.validator._burn_pool.shutdown(wait=True)
+
+    def _expected_scores(self, scope: str) -> list:
+        """Reference per-miner scores for a campaign, with P95 from the primary campaign's window."""
+        percentiles = compute_auto_p95(
+            [stats for _, stats in MINER_STATS["A"]], use_flooring=self.scope_config.use_flooring
+        )
+        calculator = ScoreCalculator(
+            p95_provider=_FixedP95Provider(percentiles),
+            use_soft_cap=self.scope_config.use_soft_cap,
+            use_flooring=self.scope_config.use_flooring,
+            w_sales=self.scope_config.w_sales,
+            w_rev=self.scope_config.w_rev,
+            soft_cap_threshold=self.scope_config.soft_cap_threshold,
+            soft_cap_factor=self.scope_config.soft_cap_factor,
+        )
+        scores = [0.0] * len(HOTKEYS)
+        for result in calculator.score_many(MINER_STATS[scope], "mech0"):
+            scores[HOTKEYS.index(result.miner_id)] = result.score
+        return scores
+
+    def test_zero_emission_campaign_not_scored_but_seeds_p95(self):
+        """A zero-emission primary campaign is skipped, yet its window still drives P95."""
+        self.validator.campaign_source.get_campaigns.return_value = [
+            Campaign(scope="A", mech_id=0, emission_split=0.0),
+            Campaign(scope="B", mech_id=0, emission_split=100.0),
+        ]
+
+        self.validator._process_weights()
+
+        # Both windows come from the batch fetch with the configured window_days;
+        # no default-window refetch for P95.
+        self.validator.miner_stats_source.fetch_window_many.assert_called_once()
+        self.assertEqual(
+            self.validator.miner_stats_source.fetch_window_many.call_args[0][0],
+            [("A", WINDOW_DAYS), ("B", WINDOW_DAYS)],
+        )
+        self.validator.miner_stats_source.fetch_window.assert_not_called()
+        # Burn is only resolved for the campaign with emission share
+        self.validator.burn_percentage_resolver.assert_called_once_with("mech0", miner_stats_scope="B")
+
+        self.validator.score_sink.publish_weights.assert_called_once()
+        weights, scope = self.validator.score_sink.publish_weights.call_args[0]
+        self.assertEqual(scope, "mech0")
+
+        # Campaign B alone makes up the aggregate; A's pending-only miner keeps the minimum.
+        expected = self._expected_scores("B")
+        total = sum(expected)
+        remaining = 1.0 - PENDING_MINER_MIN_SCORE
+        pending_index = HOTKEYS.index(PENDING)
+        for i, weight in enumerate(weights.tolist()):
+            if i == pending_index:
+                self.assertAlmostEqual(weight, PENDING_MINER_MIN_SCORE, delta=TOLERANCE)
+            else:
+                self.assertAlmostEqual(weight, remaining * expected[i] / total, delta=TOLERANCE)
+        # MINER_A only has stats in the zero-emission campaign
+        self.assertAlmostEqual(weights[HOTKEYS.index(MINER_A)], 0.0, delta=TOLERANCE)
+
+    def test_emission_splits_weight_campaigns(self):
+        """Campaign weight vectors are combined in proportion to their emission splits."""
+        self.validator.pending_miners_source.get_pending_miners_many.side_effect = (
+            lambda scopes, executor=None: {scope: set() for scope in scopes}
+        )
+        self.validator.campaign_source.get_campaigns.return_value = [
+            Campaign(scope="A", mech_id=0, emission_split=25.0),
+            Campaign(scope="B", mech_id=0, emission_split=75.0),
+        ]
+
+        self.validator._process_weights()
+
+        weights, _ = self.validator.score_sink.publish_weights.call_args[0]
+        scores_a = self._expected_scores("A")
+        scores_b = self._expected_scores("B")
+        total_a, total_b = sum(scores_a), sum(scores_b)
+        for i, weight in enumerate(weights.tolist()):
+            expected = 0.25 * scores_a[i] / total_a + 0.75 * scores_b[i] / total_b
+            self.assertAlmostEqual(weight, expected, delta=TOLERANCE)
+        self.assertAlmostEqual(sum(weights), 1.0, delta=TOLERANCE)
+
+    def test_all_zero_scores_fall_back_to_owner(self):
+        """An all-zero aggregate falls back to owner-only weights with the cycle's owner index."""
+        self.validator.pending_miners_source.get_pending_miners_many.side_effect = (
+            lambda scopes, executor=None: {scope: set() for scope in scopes}
+        )
+        self.validator.miner_stats_source.fetch_window_many.side_effect = (
+            lambda scope_windows, executor=None: {sw: [] for sw in scope_windows}
+        )
+        self.validator.score_sink._get_owner_index.return_value = None
+        self.validator.campaign_source.get_campaigns.return_value = [
+            Campaign(scope="B", mech_id=0, emission_split=100.0),
+        ]
+
+        self.validator._process_weights()
+
+        # The owner index resolved at the start of the cycle is reused, not looked up again
+        self.validator.score_sink._get_owner_index.assert_called_once()
+        self.validator.score_sink.set_weights_to_owner_only.assert_called_once_with(None)
+        self.validator.score_sink.publish_weights.assert_not_called()
+
+    def test_prefetch_collected_on_early_return(self):
+        """A cycle that returns early still consumes the prefetch so the next wait starts a new one."""
+        prefetch = Future()
+        prefetch.set_result({("A", WINDOW_DAYS): MINER_STATS["A"]})
+        self.validator._prefetch_future = prefetch
+        self.validator.campaign_source.get_campaigns.return_value = []
+
+        self.validator._process_weights()
+
+        self.assertIsNone(self.validator._prefetch_future)
+        self.validator.score_sink.set_weights_to_owner_only.assert_called_once_with()
+
+    def test_scope_configs_reset_after_cycle(self):
+        """The per-cycle config map is emptied even if the cycle raises."""
+        self.validator.campaign_source.get_campaigns.return_value = [
+            Campaign(scope="A", mech_id=0, emission_split=100.0),
+        ]
+        self.validator.score_sink.publish_weights.side_effect = RuntimeError("extrinsic failed")
+
+        with self.assertRaises(RuntimeError):
+            self.validator._process_weights()
+
+        self.assertEqual(self.validator._scope_configs, {})
+        # Later lookups go back to the config source
+        self.assertIs(self.validator._get_scope_config("mech0"), self.scope_config)
+        self.validator.dynamic_config_source.get_config.assert_called_with("mech0")
+
+if __name__ == "__main__":
+    unittest.main()